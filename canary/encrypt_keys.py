@@ -1,4 +1,4 @@
-"""Encrypt Binance API credentials into keys.json.enc using OpenSSL AES-256-CBC."""
+"""Encrypt Binance API credentials into keys.json.enc (OpenSSL-compatible AES-256-CBC)."""
 
 from __future__ import annotations
 
@@ -6,41 +6,36 @@ import argparse
 import getpass
 import json
 import os
-import subprocess
-import tempfile
+
+from cryptography.hazmat.primitives import hashes, padding
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
+# Matches ``openssl enc -aes-256-cbc -pbkdf2 -salt`` defaults so files stay
+# decryptable by the OpenSSL CLI (see canary/nuclear_option.py).
+OPENSSL_MAGIC = b"Salted__"
+SALT_BYTES = 8
+PBKDF2_ITERATIONS = 10_000
 
 
 def encrypt_payload(payload: dict[str, str], passphrase: str, output_path: str) -> None:
-    with tempfile.NamedTemporaryFile("w", delete=False) as plain_file:
-        json.dump(payload, plain_file)
-        plain_path = plain_file.name
+    """Encrypt ``payload`` in-process; plaintext and passphrase never touch disk."""
+    salt = os.urandom(SALT_BYTES)
+    key_iv = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=48,
+        salt=salt,
+        iterations=PBKDF2_ITERATIONS,
+    ).derive(passphrase.encode())
+    key, iv = key_iv[:32], key_iv[32:]
 
-    with tempfile.NamedTemporaryFile("w", delete=False) as pass_file:
-        pass_file.write(passphrase)
-        pass_path = pass_file.name
+    padder = padding.PKCS7(algorithms.AES.block_size).padder()
+    padded = padder.update(json.dumps(payload).encode()) + padder.finalize()
+    encryptor = Cipher(algorithms.AES(key), modes.CBC(iv)).encryptor()
+    ciphertext = encryptor.update(padded) + encryptor.finalize()
 
-    try:
-        subprocess.run(
-            [
-                "openssl",
-                "enc",
-                "-aes-256-cbc",
-                "-pbkdf2",
-                "-salt",
-                "-in",
-                plain_path,
-                "-out",
-                output_path,
-                "-pass",
-                f"file:{pass_path}",
-            ],
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-    finally:
-        os.remove(plain_path)
-        os.remove(pass_path)
+    with open(output_path, "wb") as out_file:
+        out_file.write(OPENSSL_MAGIC + salt + ciphertext)
 
 
 def main(argv: list[str] | None = None) -> int:
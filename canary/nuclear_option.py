@@ -10,8 +10,10 @@ import json
 import os
 import subprocess
 import sys
-import tempfile
 import time
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any
 
@@ -73,10 +75,8 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
 
 
 def decrypt_keys(keys_file: str, passphrase: str) -> dict[str, Any]:
-    with tempfile.NamedTemporaryFile("w", delete=False) as pass_file:
-        pass_file.write(passphrase)
-        pass_file_path = pass_file.name
-
+    # Passphrase goes over stdin so it never lands on disk; output stays bytes
+    # (json.loads accepts them) to skip a needless UTF-8 decode.
     try:
         result = subprocess.run(
             [
@@ -88,16 +88,14 @@ def decrypt_keys(keys_file: str, passphrase: str) -> dict[str, Any]:
                 "-in",
                 keys_file,
                 "-pass",
-                f"file:{pass_file_path}",
+                "stdin",
             ],
+            input=passphrase.encode() + b"\n",
             capture_output=True,
             check=True,
-            text=True,
         )
     except subprocess.CalledProcessError as exc:
         raise ValueError("Failed to decrypt keys.json.enc") from exc
-    finally:
-        os.remove(pass_file_path)
 
     return json.loads(result.stdout)
 
@@ -126,8 +124,16 @@ def build_exchange(credentials: dict[str, Any], market: str):
 def fetch_all_positions(spot_exchange: Any, futures_exchange: Any) -> list[CloseAction]:
     actions: list[CloseAction] = []
 
-    balances = spot_exchange.fetch_balance()
+    # ccxt instances are not thread-safe and fetch_balance loads markets
+    # itself, so warm the spot markets first and only overlap the calls
+    # that run on separate exchange instances.
     markets = spot_exchange.load_markets()
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        balances_future = pool.submit(spot_exchange.fetch_balance)
+        positions_future = pool.submit(futures_exchange.fetch_positions)
+        balances = balances_future.result()
+        futures_positions = positions_future.result()
+
     for asset, amount_info in balances.get("total", {}).items():
         amount = float(amount_info or 0)
         if amount <= 0:
@@ -139,7 +145,6 @@ def fetch_all_positions(spot_exchange: Any, futures_exchange: Any) -> list[Close
             CloseAction(market="spot", symbol=symbol, side="sell", amount=amount)
         )
 
-    futures_positions = futures_exchange.fetch_positions()
     for pos in futures_positions:
         contracts = float(pos.get("contracts") or 0)
         if contracts == 0:
@@ -174,6 +179,151 @@ def hibernate_account(futures_exchange: Any) -> bool:
         return False
 
 
+# Binance futures batchOrders accepts at most 5 orders per request.
+MAX_BATCH_ORDERS = 5
+
+
+def _dry_run_result(action: CloseAction) -> dict[str, Any]:
+    return {
+        "status": "dry_run",
+        "market": action.market,
+        "symbol": action.symbol,
+        "side": action.side,
+        "amount": action.amount,
+    }
+
+
+def _executed_result(action: CloseAction, order: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "status": "executed",
+        "market": action.market,
+        "symbol": action.symbol,
+        "side": action.side,
+        "amount": action.amount,
+        "order_id": order.get("id"),
+    }
+
+
+def _failed_result(action: CloseAction, error: Any) -> dict[str, Any]:
+    return {
+        "status": "failed",
+        "market": action.market,
+        "symbol": action.symbol,
+        "error": str(error),
+    }
+
+
+def _unknown_result(action: CloseAction, error: Any) -> dict[str, Any]:
+    # The order may or may not have been placed; check the venue before retrying.
+    return {
+        "status": "unknown",
+        "market": action.market,
+        "symbol": action.symbol,
+        "error": str(error),
+    }
+
+
+def _client_order_id() -> str:
+    # Binance caps client order ids at 36 chars of [.A-Z:/a-z0-9_-].
+    return f"nuclear-{uuid.uuid4().hex[:24]}"
+
+
+def _supports_batch_orders(exchange: Any) -> bool:
+    return getattr(exchange, "has", {}).get("createOrders") is True
+
+
+def _close_single(exchange: Any, action: CloseAction) -> dict[str, Any]:
+    try:
+        order = exchange.create_order(
+            action.symbol,
+            "market",
+            action.side,
+            action.amount,
+        )
+    except Exception as e:
+        return _failed_result(action, e)
+    return _executed_result(action, order)
+
+
+def _close_batch(exchange: Any, batch: list[CloseAction]) -> list[dict[str, Any]]:
+    """Submit ``batch`` in one createOrders request.
+
+    ccxt's parse_orders sorts the reply by timestamp, so replies are matched
+    back to actions by client order id (then by a unique symbol), never by
+    position. Actions without a matching reply are reported as unknown.
+
+    A failed request is reported, not retried order-by-order: part of the
+    batch may already have filled, and resubmitting could flip a position.
+    """
+    client_ids = [_client_order_id() for _ in batch]
+    try:
+        orders = exchange.create_orders(
+            [
+                {
+                    "symbol": action.symbol,
+                    "type": "market",
+                    "side": action.side,
+                    "amount": action.amount,
+                    "params": {"newClientOrderId": client_id},
+                }
+                for action, client_id in zip(batch, client_ids, strict=True)
+            ]
+        )
+    except Exception as e:
+        return [_failed_result(action, e) for action in batch]
+
+    placed = [order for order in orders or [] if order and order.get("id") is not None]
+    by_client_id = {
+        order["clientOrderId"]: order for order in placed if order.get("clientOrderId")
+    }
+    unmatched = [
+        order for order in placed if order.get("clientOrderId") not in client_ids
+    ]
+
+    errors = [o.get("info") for o in orders or [] if o and o.get("id") is None]
+    symbol_counts = Counter(action.symbol for action in batch)
+
+    results: list[dict[str, Any]] = []
+    for action, client_id in zip(batch, client_ids, strict=True):
+        order = by_client_id.get(client_id)
+        if order is None and symbol_counts[action.symbol] == 1:
+            candidates = [o for o in unmatched if o.get("symbol") == action.symbol]
+            if len(candidates) == 1:
+                order = candidates[0]
+        if order is None:
+            results.append(
+                _unknown_result(
+                    action, f"no matching order in batch response; errors: {errors}"
+                )
+            )
+        else:
+            results.append(_executed_result(action, order))
+    return results
+
+
+def _close_chunk(
+    chunk: list[CloseAction], *, spot_exchange: Any, futures_exchange: Any
+) -> list[dict[str, Any]]:
+    results: list[dict[str, Any] | None] = [None] * len(chunk)
+
+    # Futures closes go out via createOrders when the venue supports it;
+    # spot (and venues without batch support) fall back to one order each.
+    if _supports_batch_orders(futures_exchange):
+        batchable = [i for i, a in enumerate(chunk) if a.market == "futures"]
+        for offset in range(0, len(batchable), MAX_BATCH_ORDERS):
+            indices = batchable[offset : offset + MAX_BATCH_ORDERS]
+            batch_results = _close_batch(futures_exchange, [chunk[i] for i in indices])
+            for i, result in zip(indices, batch_results, strict=True):
+                results[i] = result
+
+    for i, action in enumerate(chunk):
+        if results[i] is None:
+            exchange = spot_exchange if action.market == "spot" else futures_exchange
+            results[i] = _close_single(exchange, action)
+
+    return [result for result in results if result is not None]
+
+
 def market_close_all(
     actions: list[CloseAction],
     *,
@@ -184,49 +334,23 @@ def market_close_all(
     rate_limit_ms: int,
 ) -> list[dict[str, Any]]:
     results: list[dict[str, Any]] = []
+    step = max(batch_size, 1)
 
-    for idx, action in enumerate(actions, start=1):
-        exchange = spot_exchange if action.market == "spot" else futures_exchange
+    for start in range(0, len(actions), step):
+        chunk = actions[start : start + step]
 
         if dry_run:
-            results.append(
-                {
-                    "status": "dry_run",
-                    "market": action.market,
-                    "symbol": action.symbol,
-                    "side": action.side,
-                    "amount": action.amount,
-                }
-            )
+            results.extend(_dry_run_result(action) for action in chunk)
         else:
-            try:
-                order = exchange.create_order(
-                    action.symbol,
-                    "market",
-                    action.side,
-                    action.amount,
-                )
-                results.append(
-                    {
-                        "status": "executed",
-                        "market": action.market,
-                        "symbol": action.symbol,
-                        "side": action.side,
-                        "amount": action.amount,
-                        "order_id": order.get("id"),
-                    }
-                )
-            except Exception as e:
-                results.append(
-                    {
-                        "status": "failed",
-                        "market": action.market,
-                        "symbol": action.symbol,
-                        "error": str(e),
-                    }
+            results.extend(
+                _close_chunk(
+                    chunk,
+                    spot_exchange=spot_exchange,
+                    futures_exchange=futures_exchange,
                 )
+            )
 
-        if idx % max(batch_size, 1) == 0:
+        if len(chunk) == step:
             time.sleep(max(rate_limit_ms, 0) / 1000.0)
 
     return results
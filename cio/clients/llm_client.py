@@ -1,3 +1,4 @@
+import asyncio
 import json
 import logging
 import os
@@ -42,6 +43,22 @@ def _build_routing_model(model: str, api_base: str | None) -> str:
     return f"{prefix}{model}"
 
 
+def _latency_kwargs(routing_model: str, api_base: str | None) -> dict[str, Any]:
+    """
+    Vendor latency knobs for ``LLM_LATENCY_MODE=optimized`` (default ``standard``).
+    Only applied on direct provider routes: OpenAI-compatible proxies (api_base
+    set) may reject parameters they don't recognise.
+    """
+    mode = os.getenv("LLM_LATENCY_MODE", "standard").strip().lower()
+    if mode != "optimized" or api_base:
+        return {}
+    if routing_model.startswith("bedrock/"):
+        return {"performanceConfig": {"latency": "optimized"}}
+    if routing_model.startswith("openai/"):
+        return {"service_tier": "priority"}
+    return {}
+
+
 def _supports_json_mode(litellm_module: Any, routing_model: str) -> bool:
     if not _env_bool("LLM_SUPPORTS_JSON_MODE", default=True):
         return False
@@ -280,6 +297,9 @@ class CIO_LLM_Client(ABC):
 # Default Model Pins (Fix 5)
 DEFAULT_PRIMARY_MODEL = "anthropic/claude-3-haiku-20240307"
 DEFAULT_FALLBACK_MODEL = "openai/gpt-4o-mini"
+# Upper bound on concurrent provider requests per client; bursts queue
+# locally instead of tripping provider 429s and the retry/backoff path.
+DEFAULT_MAX_INFLIGHT = 16
 
 
 class LiteLLMClient(CIO_LLM_Client):
@@ -291,6 +311,17 @@ class LiteLLMClient(CIO_LLM_Client):
         self._failure_count = 0
         self._last_failure_time = 0.0
         self._breaker_open_until = 0.0
+        max_inflight = int(os.getenv("LLM_MAX_INFLIGHT", str(DEFAULT_MAX_INFLIGHT)))
+        self._inflight = asyncio.Semaphore(max(max_inflight, 1))
+
+    async def _acompletion(self, litellm_module: Any, **kwargs: Any) -> Any:
+        """litellm.acompletion gated by the in-flight limit.
+
+        The permit is held only for the request itself, so retry backoff
+        sleeps don't occupy a slot.
+        """
+        async with self._inflight:
+            return await litellm_module.acompletion(**kwargs)
 
     def _response_format_for_completion(
         self, litellm_module: Any, routing_model: str
@@ -373,6 +404,30 @@ class LiteLLMClient(CIO_LLM_Client):
 
         start_time = time.perf_counter()
 
+        # Serialise the context once; retries and the fallback reuse it. A
+        # non-serialisable context is a failed call, not an exception.
+        try:
+            messages = [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": json.dumps(user_context)},
+            ]
+        except (TypeError, ValueError) as encode_error:
+            self._record_failure()
+            logger.error(
+                f"LLM user context for {prompt_id} is not JSON-serialisable: "
+                f"{encode_error}"
+            )
+            return RawLLMResponse(
+                prompt_id=prompt_id,
+                content="",
+                error=f"Invalid user context: {encode_error}",
+                model=primary_model,
+                input_tokens=0,
+                output_tokens=0,
+                latency_ms=int((time.perf_counter() - start_time) * 1000),
+                timestamp=datetime.now(UTC),
+            )
+
         # 2. Retry Loop for Primary Model
         try:
             async for attempt in AsyncRetrying(
@@ -391,16 +446,15 @@ class LiteLLMClient(CIO_LLM_Client):
                 ),
             ):
                 with attempt:
-                    response = await litellm.acompletion(
+                    response = await self._acompletion(
+                        litellm,
                         model=routing_primary,
                         api_base=api_base,
-                        messages=[
-                            {"role": "system", "content": system_prompt},
-                            {"role": "user", "content": json.dumps(user_context)},
-                        ],
+                        messages=messages,
                         response_format=self._response_format_for_completion(
                             litellm, routing_primary
                         ),
+                        **_latency_kwargs(routing_primary, api_base),
                     )
 
             # Success on primary
@@ -417,16 +471,15 @@ class LiteLLMClient(CIO_LLM_Client):
             )
 
             try:
-                fallback_response = await litellm.acompletion(
+                fallback_response = await self._acompletion(
+                    litellm,
                     model=routing_fallback,
                     api_base=fallback_api_base,
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": json.dumps(user_context)},
-                    ],
+                    messages=messages,
                     response_format=self._response_format_for_completion(
                         litellm, routing_fallback
                     ),
+                    **_latency_kwargs(routing_fallback, fallback_api_base),
                 )
 
                 # Success on fallback
@@ -477,7 +530,8 @@ class LiteLLMClient(CIO_LLM_Client):
 
         try:
             start_time = time.perf_counter()
-            response = await litellm.acompletion(
+            response = await self._acompletion(
+                litellm,
                 model=routing_fallback,
                 api_base=fallback_api_base,
                 messages=[
@@ -487,6 +541,7 @@ class LiteLLMClient(CIO_LLM_Client):
                 response_format=self._response_format_for_completion(
                     litellm, routing_fallback
                 ),
+                **_latency_kwargs(routing_fallback, fallback_api_base),
             )
             return self._process_response(
                 prompt_id, response, int((time.perf_counter() - start_time) * 1000)
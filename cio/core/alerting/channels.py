@@ -2,6 +2,7 @@ import asyncio
 import logging
 import os
 import smtplib
+import threading
 from abc import ABC, abstractmethod
 from email.mime.text import MIMEText
 from typing import Any
@@ -17,6 +18,10 @@ class AlertChannel(ABC):
     async def send(self, message: str, context: dict[str, Any]) -> bool:
         pass
 
+    async def aclose(self) -> None:
+        """Releases any connection the channel keeps between alerts."""
+        return None
+
 
 class GrafanaChannel(AlertChannel):
     """
@@ -27,25 +32,38 @@ class GrafanaChannel(AlertChannel):
     def __init__(self):
         self.api_url = os.getenv("GRAFANA_API_URL")
         self.api_key = os.getenv("GRAFANA_API_KEY")
+        # Created on first use and kept for the process lifetime so repeated
+        # alerts reuse the pooled TLS connection instead of re-handshaking.
+        self._client: httpx.AsyncClient | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                headers={"Authorization": f"Bearer {self.api_key}"},
+                timeout=5.0,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def send(self, message: str, context: dict[str, Any]) -> bool:
         # 1. Primary path: HTTP API for Annotations (visibility in dashboards)
         if self.api_url and self.api_key:
             try:
-                async with httpx.AsyncClient() as client:
-                    payload = {
-                        "text": message,
-                        "tags": ["alert", "cio", context.get("alert_type", "RED")],
-                        "time": int(context.get("timestamp", 0) * 1000) or None,
-                    }
-                    response = await client.post(
-                        f"{self.api_url}/api/annotations",
-                        json=payload,
-                        headers={"Authorization": f"Bearer {self.api_key}"},
-                        timeout=5.0,
-                    )
-                    if response.status_code not in (200, 201):
-                        logger.error(f"Grafana API alert failed: {response.text}")
+                payload = {
+                    "text": message,
+                    "tags": ["alert", "cio", context.get("alert_type", "RED")],
+                    "time": int(context.get("timestamp", 0) * 1000) or None,
+                }
+                response = await self._get_client().post(
+                    f"{self.api_url}/api/annotations",
+                    json=payload,
+                )
+                if response.status_code not in (200, 201):
+                    logger.error(f"Grafana API alert failed: {response.text}")
             except Exception as e:
                 logger.error(f"Error sending alert to Grafana API: {e}")
 
@@ -84,13 +102,75 @@ class EmailChannel(AlertChannel):
         self.smtp_pass = os.getenv("SMTP_PASS")
         self.from_email = os.getenv("ALERT_EMAIL_FROM", "alerts@petrosa.com")
         self.to_email = os.getenv("ALERT_EMAIL_TO", "admin@petrosa.com")
-
-    def _send_sync(self, msg: MIMEText):
-        """Synchronous SMTP send to be run in a thread."""
-        with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
+        # Bounds every socket op so a half-open connection cannot hold the
+        # send lock (and every queued alert) until the TCP retransmit timeout.
+        self.smtp_timeout = float(os.getenv("SMTP_TIMEOUT_SECONDS", "10"))
+        self._smtp: smtplib.SMTP | None = None
+        # Sends run in worker threads; one connection must not be shared
+        # by two of them at once.
+        self._smtp_lock = threading.Lock()
+
+    def _connect(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=self.smtp_timeout)
+        try:
             server.starttls()
             server.login(self.smtp_user, self.smtp_pass)
-            server.send_message(msg)
+        except Exception:
+            server.close()
+            raise
+        self._smtp = server
+        return server
+
+    def _cached_session(self) -> smtplib.SMTP | None:
+        """Return the cached session if it still answers NOOP, else drop it."""
+        server = self._smtp
+        if server is None:
+            return None
+        try:
+            if server.noop()[0] == 250:
+                return server
+        except (smtplib.SMTPException, OSError):
+            pass
+        self._disconnect()
+        return None
+
+    def _disconnect(self) -> None:
+        server, self._smtp = self._smtp, None
+        if server is None:
+            return
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
+
+    def _close_sync(self) -> None:
+        with self._smtp_lock:
+            self._disconnect()
+
+    async def aclose(self) -> None:
+        """QUITs the cached SMTP session; waits for any in-flight send."""
+        await asyncio.to_thread(self._close_sync)
+
+    def _send_sync(self, msg: MIMEText):
+        """Synchronous SMTP send to be run in a thread.
+
+        Reuses one authenticated connection across alerts so each send skips
+        the TCP + STARTTLS + AUTH handshake. The cached session is checked
+        with NOOP before reuse, and a disconnect during the send is retried
+        once on a fresh connection.
+        """
+        with self._smtp_lock:
+            try:
+                server = self._cached_session() or self._connect()
+                try:
+                    server.send_message(msg)
+                except smtplib.SMTPServerDisconnected:
+                    self._disconnect()
+                    self._connect().send_message(msg)
+            except Exception:
+                # Never keep a connection in an unknown state.
+                self._disconnect()
+                raise
 
     async def send(self, message: str, context: dict[str, Any]) -> bool:
         if not self.smtp_user or not self.smtp_pass:
@@ -40,3 +40,8 @@ class AlertManager:
 
         # 2. Redundant Multi-Channel Dispatch (Grafana API, Otel, Email)
         await AlertManager._dispatcher.dispatch(message, payload)
+
+    @staticmethod
+    async def aclose():
+        """Releases pooled alert-channel connections at shutdown."""
+        await AlertManager._dispatcher.aclose()
@@ -50,3 +50,13 @@ class RedundantAlertDispatcher:
                 )
 
         return success_count > 0
+
+    async def aclose(self) -> None:
+        """Closes channel connections; called once at service shutdown."""
+        for channel in self.channels:
+            try:
+                await channel.aclose()
+            except Exception as e:
+                logger.warning(
+                    f"Error closing channel {channel.__class__.__name__}: {e}"
+                )
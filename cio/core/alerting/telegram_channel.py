@@ -29,11 +29,24 @@ class TelegramChannel:
     ) -> None:
         self._bot_token = bot_token or os.getenv("TELEGRAM_BOT_TOKEN", "")
         self._chat_id = chat_id or os.getenv("TELEGRAM_CHAT_ID", "")
+        # Created on first send and reused so every forwarded alert skips
+        # the TCP + TLS handshake to api.telegram.org.
+        self._client: httpx.AsyncClient | None = None
 
     @property
     def is_configured(self) -> bool:
         return bool(self._bot_token and self._chat_id)
 
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=10.0)
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     async def send(self, text: str, extra: dict[str, Any] | None = None) -> bool:
         """Send *text* to the configured chat. Returns True on HTTP 200.
 
@@ -54,8 +67,7 @@ class TelegramChannel:
             "parse_mode": "HTML",
         }
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                resp = await client.post(url, json=payload)
+            resp = await self._get_client().post(url, json=payload)
             if resp.status_code == 200:
                 return True
             logger.warning(
@@ -43,6 +43,11 @@ _forwarded = Counter(
     "Total alerts.> messages forwarded (or attempted) to Telegram",
     ["result"],
 )
+# Pre-bound children for the fixed result set: skips the labels() lookup
+# (tuple build + locked dict get) on every forwarded message.
+_forwarded_ok = _forwarded.labels(result="ok")
+_forwarded_failed = _forwarded.labels(result="failed")
+_forwarded_parse_error = _forwarded.labels(result="parse_error")
 
 
 def _subject_prefix(subject: str) -> str:
@@ -106,6 +111,7 @@ class AlertsConsumer:
             except Exception as exc:  # noqa: BLE001
                 logger.warning("alerts_consumer.unsubscribe_failed exc=%s", exc)
             self._subscription = None
+        await self._telegram.aclose()
 
     async def _handle_message(self, msg) -> None:
         subject = msg.subject
@@ -117,7 +123,7 @@ class AlertsConsumer:
             logger.warning(
                 "alerts_consumer.parse_error subject=%s error=%s", subject, exc
             )
-            _forwarded.labels(result="parse_error").inc()
+            _forwarded_parse_error.inc()
             return
 
         text = _format_telegram_message(subject, payload)
@@ -128,9 +134,9 @@ class AlertsConsumer:
                 "alerts_consumer.telegram_raised subject=%s exc=%s", subject, exc
             )
             ok = False
-        result = "ok" if ok else "failed"
-        _forwarded.labels(result=result).inc()
         if ok:
+            _forwarded_ok.inc()
             logger.info("alerts_consumer.forwarded subject=%s", subject)
         else:
+            _forwarded_failed.inc()
             logger.warning("alerts_consumer.forward_failed subject=%s", subject)
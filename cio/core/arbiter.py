@@ -48,7 +48,13 @@ _SIDE_NORMALISE: dict[str, str] = {
 
 def _normalise_action(raw: str) -> str:
     """Map producer-specific side names (long/short/bullish/bearish) to buy/sell."""
-    return _SIDE_NORMALISE.get(raw.lower(), raw.lower())
+    # Fast path: most producers already publish lowercase sides, so skip the
+    # .lower() copy when the raw value is a direct hit.
+    canonical = _SIDE_NORMALISE.get(raw)
+    if canonical is not None:
+        return canonical
+    lowered = raw.lower()
+    return _SIDE_NORMALISE.get(lowered, lowered)
 
 
 class SignalArbiter:
@@ -141,9 +147,13 @@ class SignalArbiter:
 
         canonical_action = _normalise_action(action)
 
-        # 1. Deduplication guard (60 s window, same symbol + canonical action)
+        # Both arbitration keys are read in one MGET round-trip.
         dedup_key = f"arbiter:dedup:{symbol}:{canonical_action}"
-        if await self._cache.get(dedup_key):
+        bias_key = f"arbiter:bias:{symbol}"
+        dedup_hit, raw_bias = await self._cache.get_many([dedup_key, bias_key])
+
+        # 1. Deduplication guard (60 s window, same symbol + canonical action)
+        if dedup_hit:
             reason = (
                 f"SIGNAL_DEDUPLICATED: {symbol} {canonical_action} already published "
                 f"within the last {_DEDUP_TTL_SECONDS}s (strategy={strategy_id})"
@@ -152,8 +162,6 @@ class SignalArbiter:
             return False, reason
 
         # 2. Conflict detection (5 min window, opposing action for same symbol)
-        bias_key = f"arbiter:bias:{symbol}"
-        raw_bias = await self._cache.get(bias_key)
         stored_action: str | None = None
         stored_conf: float = 0.0
         stored_strategy: str = "unknown"
@@ -192,9 +200,14 @@ class SignalArbiter:
                     extra={"correlation_id": correlation_id},
                 )
 
-        # 3. Signal is allowed — record state in Redis
+        # 3. Signal is allowed — record state in Redis. Both writes go out in
+        # one pipelined round-trip.
         bias_value = f"{canonical_action}:{confidence:.6f}:{strategy_id}"
-        await self._cache.set(bias_key, bias_value, ttl=_CONFLICT_TTL_SECONDS)
-        await self._cache.set(dedup_key, "1", ttl=_DEDUP_TTL_SECONDS)
+        await self._cache.set_many(
+            {
+                bias_key: (bias_value, _CONFLICT_TTL_SECONDS),
+                dedup_key: ("1", _DEDUP_TTL_SECONDS),
+            }
+        )
 
         return True, "allowed"
@@ -31,3 +31,25 @@ class AsyncRedisCache:
             await self.redis.set(key, value, ex=ttl)
         except Exception as e:
             logger.error(f"Redis set error for key {key}: {e}")
+
+    async def get_many(self, keys: list[str]) -> list[str | None]:
+        """Retrieves several values in a single MGET round-trip."""
+        try:
+            values = await self.redis.mget(keys)
+            return [
+                (value.decode("utf-8") if isinstance(value, bytes) else value) or None
+                for value in values
+            ]
+        except Exception as e:
+            logger.error(f"Redis mget error for keys {keys}: {e}")
+            return [None] * len(keys)
+
+    async def set_many(self, items: dict[str, tuple[str, int]]):
+        """Stores several ``key -> (value, ttl)`` entries in one pipelined round-trip."""
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key, (value, ttl) in items.items():
+                    pipe.set(key, value, ex=ttl)
+                await pipe.execute()
+        except Exception as e:
+            logger.error(f"Redis pipelined set error for keys {list(items)}: {e}")
@@ -1,6 +1,7 @@
 import asyncio
 import logging
 import os
+import time
 from datetime import datetime
 from typing import Any
 
@@ -43,6 +44,11 @@ COLD_TRIGGERS = {
     TriggerType.ESCALATION,
 }
 
+# Data-manager recomputes the regime on a minutes-scale cadence, so a short
+# per-symbol cache collapses bursts of intents on the same pair into a single
+# /analysis/regime round-trip. 0 disables the cache.
+DEFAULT_REGIME_CACHE_TTL_SECONDS = 1.0
+
 
 class ContextBuilder:
     """
@@ -56,6 +62,7 @@ class ContextBuilder:
         tradeengine_url: str,
         vector_client: VectorClientProtocol | None = None,
         evaluator_subscriber: Any | None = None,
+        regime_cache_ttl_seconds: float | None = None,
     ):
         self.data_manager_url = data_manager_url
         self.tradeengine_url = tradeengine_url
@@ -66,6 +73,21 @@ class ContextBuilder:
         # path — the bundle is then assembled with an empty verdicts
         # dict and downstream stories (122.2) handle the fallback.
         self.evaluator_subscriber = evaluator_subscriber
+        if regime_cache_ttl_seconds is None:
+            regime_cache_ttl_seconds = float(
+                os.getenv(
+                    "REGIME_CACHE_TTL_SECONDS", str(DEFAULT_REGIME_CACHE_TTL_SECONDS)
+                )
+            )
+        self._regime_cache_ttl = max(regime_cache_ttl_seconds, 0.0)
+        # symbol -> (RegimeResult, monotonic expiry). Only successful
+        # data-manager reads are cached; fallbacks always re-fetch so the
+        # per-build gap collector keeps seeing the outage.
+        self._regime_cache: dict[str, tuple[RegimeResult, float]] = {}
+        # symbol -> in-flight data-manager request. Concurrent cache misses
+        # for the same pair await one shared request instead of each
+        # issuing their own.
+        self._regime_inflight: dict[str, asyncio.Future[Any]] = {}
         token = os.getenv("PETROSA_INTERNAL_TOKEN", "")
         if not token:
             logger.warning(
@@ -439,13 +461,17 @@ class ContextBuilder:
         supplied by ``build()``. Existing test paths that call this method
         directly (e.g. tests/unit/test_cold_path.py:115) pass no
         collectors, so the existing return contract is preserved.
+
+        Successful reads are cached per symbol for
+        ``REGIME_CACHE_TTL_SECONDS`` so concurrent intents on the same pair
+        share one data-manager round-trip; misses that overlap in time are
+        coalesced onto a single in-flight request.
         """
+        cached = self._regime_cache.get(symbol)
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
         try:
-            url = f"{self.data_manager_url}/analysis/regime?pair={symbol}"
-            response = await self.client.get(url)
-            response.raise_for_status()
-
-            data = response.json()
+            data = await self._request_regime(symbol)
             # Defensive check: Data Manager returns 200 OK with an error message in metadata
             metadata = data.get("metadata", {})
             if (
@@ -471,7 +497,13 @@ class ContextBuilder:
                 )
 
             api_resp = RegimeAPIResponse.model_validate(data)
-            return RegimeResult.from_api_response(api_resp)
+            regime = RegimeResult.from_api_response(api_resp)
+            if self._regime_cache_ttl > 0:
+                self._regime_cache[symbol] = (
+                    regime,
+                    time.monotonic() + self._regime_cache_ttl,
+                )
+            return regime
         except Exception as e:
             logger.error(
                 f"Failed to fetch regime: {e}", extra={"correlation_id": correlation_id}
@@ -494,6 +526,24 @@ class ContextBuilder:
                 thought_trace=f"Error fetching regime: {str(e)}",
             )
 
+    async def _request_regime(self, symbol: str) -> Any:
+        """Single-flight GET of the raw regime payload for ``symbol``."""
+        inflight = self._regime_inflight.get(symbol)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._get_regime_payload(symbol))
+            self._regime_inflight[symbol] = inflight
+            inflight.add_done_callback(
+                lambda _: self._regime_inflight.pop(symbol, None)
+            )
+        # Shield so one cancelled caller doesn't cancel the shared request.
+        return await asyncio.shield(inflight)
+
+    async def _get_regime_payload(self, symbol: str) -> Any:
+        url = f"{self.data_manager_url}/analysis/regime?pair={symbol}"
+        response = await self.client.get(url)
+        response.raise_for_status()
+        return response.json()
+
     async def _fetch_portfolio_and_risk(
         self,
         symbol: str,
@@ -62,6 +62,9 @@ class EnvelopeFetchError(RuntimeError):
 class _CacheEntry:
     envelope: dict[str, Any]
     fetched_at: float
+    # Absolute monotonic deadline, precomputed at insert so the hot read
+    # path is a single comparison instead of a subtraction against the TTL.
+    expires_at: float
 
 
 class EnvelopeFetcher:
@@ -105,7 +108,7 @@ class EnvelopeFetcher:
                 "version": entry.envelope.get("version"),
                 "source": entry.envelope.get("source"),
                 "age_seconds": round(now - entry.fetched_at, 3),
-                "fresh": (now - entry.fetched_at) < self._ttl,
+                "fresh": entry.expires_at > now,
             }
             for key, entry in self._cache.items()
         }
@@ -125,19 +128,19 @@ class EnvelopeFetcher:
         if not key:
             raise ValueError("envelope key must be non-empty")
         cached = self._cache.get(key)
-        if cached is not None and (time.monotonic() - cached.fetched_at) < self._ttl:
+        if cached is not None and cached.expires_at > time.monotonic():
             return cached.envelope
         async with self._lock:
             # Re-check inside lock — another coroutine may have populated it.
             cached = self._cache.get(key)
-            if (
-                cached is not None
-                and (time.monotonic() - cached.fetched_at) < self._ttl
-            ):
+            if cached is not None and cached.expires_at > time.monotonic():
                 return cached.envelope
             envelope = await self._fetch(key)
+            fetched_at = time.monotonic()
             self._cache[key] = _CacheEntry(
-                envelope=envelope, fetched_at=time.monotonic()
+                envelope=envelope,
+                fetched_at=fetched_at,
+                expires_at=fetched_at + self._ttl,
             )
             return envelope
 
@@ -423,6 +423,10 @@ class CIOHealthEvaluator:
 
     async def _emit_loop(self) -> None:
         interval_s = self._emit_interval.total_seconds()
+        loop = asyncio.get_running_loop()
+        # Schedule against absolute deadlines so tick() latency doesn't
+        # accumulate into the emit cadence.
+        next_at = loop.time()
         while True:
             try:
                 await self.tick()
@@ -431,4 +435,10 @@ class CIOHealthEvaluator:
                     "cio_health_evaluator_tick_failed",
                     extra={"error": str(exc)},
                 )
-            await asyncio.sleep(interval_s)
+            next_at += interval_s
+            now = loop.time()
+            if next_at < now:
+                # Overran by more than a full interval — skip the missed
+                # slots rather than emitting a burst to catch up.
+                next_at = now
+            await asyncio.sleep(next_at - now)
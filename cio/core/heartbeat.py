@@ -1,14 +1,17 @@
 import asyncio
-import json
 import logging
 import time
 from typing import Any
 
+import orjson
 from nats.aio.client import Client as NATS
 from nats.aio.msg import Msg
 
 logger = logging.getLogger(__name__)
 
+# Reply-latency target from docs/HEARTBEAT_SPEC.md; reported, not enforced.
+RESPONSE_BUDGET_MS = 20
+
 
 class HeartbeatResponder:
     """
@@ -17,12 +20,20 @@ class HeartbeatResponder:
     """
 
     def __init__(
-        self, nats_client: NATS, redis_client: Any = None, mongo_client: Any = None
+        self,
+        nats_client: NATS,
+        redis_client: Any = None,
+        mongo_client: Any = None,
+        check_timeout_seconds: float = 0.2,
     ):
         self.nc = nats_client
         self.redis = redis_client
         self.mongo = mongo_client
         self.subscription = None
+        # Connectivity timeout per dependency: a hung dependency reports
+        # DEGRADED rather than stalling the reply. Slow-but-connected replies
+        # are flagged via health["under_budget"] instead.
+        self.check_timeout = check_timeout_seconds
 
     async def start(self, subject: str = "cio.heartbeat"):
         """Starts the heartbeat responder."""
@@ -44,6 +55,30 @@ class HeartbeatResponder:
             finally:
                 self.subscription = None
 
+    async def _check_redis(self) -> bool:
+        """PINGs Redis when a client was provided; absent clients count as healthy."""
+        if self.redis is None:
+            return True
+        try:
+            await asyncio.wait_for(self.redis.ping(), timeout=self.check_timeout)
+            return True
+        except Exception as e:
+            logger.warning(f"Heartbeat redis check failed: {e}")
+            return False
+
+    async def _check_mongo(self) -> bool:
+        """Runs the Mongo ``ping`` command when a client was provided."""
+        if self.mongo is None:
+            return True
+        try:
+            await asyncio.wait_for(
+                self.mongo.admin.command("ping"), timeout=self.check_timeout
+            )
+            return True
+        except Exception as e:
+            logger.warning(f"Heartbeat mongodb check failed: {e}")
+            return False
+
     async def _handle_ping(self, msg: Msg):
         """
         Handles incoming pings.
@@ -54,10 +89,12 @@ class HeartbeatResponder:
 
         start_time = time.perf_counter()
 
-        # 1. Dependency Health Checks (Shallow)
-        health = {"redis": True, "mongodb": True, "latency_ms": 0}
-
-        # TODO: Add actual connectivity checks if clients are provided
+        # 1. Dependency Health Checks (Shallow) — run concurrently so the
+        # reply costs one dependency RTT, not the sum of them.
+        redis_ok, mongo_ok = await asyncio.gather(
+            self._check_redis(), self._check_mongo()
+        )
+        health = {"redis": redis_ok, "mongodb": mongo_ok, "latency_ms": 0}
 
         status = "GOVERNANCE_ACTIVE"
         if not health["redis"] or not health["mongodb"]:
@@ -65,6 +102,7 @@ class HeartbeatResponder:
 
         latency_ms = int((time.perf_counter() - start_time) * 1000)
         health["latency_ms"] = latency_ms
+        health["under_budget"] = latency_ms < RESPONSE_BUDGET_MS
 
         response = {
             "status": status,
@@ -73,8 +111,8 @@ class HeartbeatResponder:
             "health": health,
         }
 
-        await self.nc.publish(msg.reply, json.dumps(response).encode())
-        logger.debug(f"Heartbeat replied: {status} in {latency_ms}ms")
+        await self.nc.publish(msg.reply, orjson.dumps(response))
+        logger.debug("Heartbeat replied: %s in %sms", status, latency_ms)
 
 
 class HeartbeatPublisher:
@@ -89,6 +127,7 @@ class HeartbeatPublisher:
         self.interval = interval_seconds
         self.task: asyncio.Task[None] | None = None
         self.running = False
+        self._stop_event: asyncio.Event | None = None
 
     async def start(self, subject: str = "cio.heartbeat"):
         """Starts the periodic heartbeat publication."""
@@ -96,6 +135,7 @@ class HeartbeatPublisher:
             return
 
         self.running = True
+        self._stop_event = asyncio.Event()
         self.task = asyncio.create_task(self._run_loop(subject))
         logger.info(
             f"Heartbeat Publisher started on subject: {subject} (interval: {self.interval}s)"
@@ -104,6 +144,9 @@ class HeartbeatPublisher:
     async def stop(self):
         """Stops the heartbeat publisher."""
         self.running = False
+        if self._stop_event is not None:
+            # Wake the loop immediately instead of waiting out the interval.
+            self._stop_event.set()
         if self.task:
             try:
                 await self.task
@@ -114,6 +157,7 @@ class HeartbeatPublisher:
 
     async def _run_loop(self, subject: str):
         """Main loop for publishing heartbeats."""
+        stop_event = self._stop_event or asyncio.Event()
         while self.running:
             try:
                 heartbeat_data = {
@@ -122,9 +166,14 @@ class HeartbeatPublisher:
                     "timestamp": time.time(),
                     "version": "1.0.0",
                 }
-                await self.nc.publish(subject, json.dumps(heartbeat_data).encode())
-                logger.debug(f"Heartbeat published to {subject}")
+                await self.nc.publish(subject, orjson.dumps(heartbeat_data))
+                logger.debug("Heartbeat published to %s", subject)
             except Exception as e:
                 logger.error(f"Error publishing heartbeat: {e}")
 
-            await asyncio.sleep(self.interval)
+            # Keep the fixed cadence even after failures so the first
+            # heartbeat after a NATS reconnect goes out on schedule.
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=self.interval)
+            except TimeoutError:
+                continue
@@ -1,8 +1,8 @@
-import json
 import logging
 import uuid
 from typing import Protocol
 
+import orjson
 from nats.aio.client import Client as NATS
 from nats.aio.msg import Msg
 
@@ -61,20 +61,20 @@ class NATSListener:
         correlation_id = msg.headers.get("correlation_id") if msg.headers else None
         if not correlation_id:
             correlation_id = uuid.uuid4().hex
-            logger.debug(f"No correlation_id in headers. Generated: {correlation_id}")
+            logger.debug("No correlation_id in headers. Generated: %s", correlation_id)
 
         # 2. Parse Payload
         try:
-            payload_raw = msg.data.decode()
-            payload = json.loads(payload_raw)
-            logger.info(
-                f"Received NATS payload on {msg.subject}: {payload_raw}",
-                extra={
-                    "correlation_id": correlation_id,
-                    "symbol": payload.get("symbol"),
-                    "action": payload.get("action"),
-                },
-            )
+            payload = orjson.loads(msg.data)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    f"Received NATS payload on {msg.subject}: {msg.data.decode()}",
+                    extra={
+                        "correlation_id": correlation_id,
+                        "symbol": payload.get("symbol"),
+                        "action": payload.get("action"),
+                    },
+                )
         except Exception as e:
             logger.error(
                 f"Failed to parse NATS payload: {e}",
@@ -92,14 +92,17 @@ class NATSListener:
                 or ""
             )
             raw_confidence = payload.get("confidence", 0.5)
-            try:
-                confidence = float(raw_confidence)
-            except (TypeError, ValueError):
-                logger.warning(
-                    f"ARBITER: non-numeric confidence {raw_confidence!r}; defaulting to 0.5",
-                    extra={"correlation_id": correlation_id},
-                )
-                confidence = 0.5
+            if isinstance(raw_confidence, float):
+                confidence = raw_confidence
+            else:
+                try:
+                    confidence = float(raw_confidence)
+                except (TypeError, ValueError):
+                    logger.warning(
+                        f"ARBITER: non-numeric confidence {raw_confidence!r}; defaulting to 0.5",
+                        extra={"correlation_id": correlation_id},
+                    )
+                    confidence = 0.5
             strategy_id_raw = payload.get("strategy_id") or payload.get(
                 "strategy", "unknown"
             )
@@ -57,7 +57,7 @@ class RateGovernor:
             data = json.loads(msg.data.decode())
             status = RateLimitStatus(**data)
             self.current_weight = status.weight_1m
-            logger.debug(f"RateGovernor updated weight: {self.current_weight}")
+            logger.debug("RateGovernor updated weight: %s", self.current_weight)
         except Exception as e:
             logger.error(f"RateGovernor failed to parse message: {e}")
 
@@ -13,6 +13,7 @@ period), the orchestrator re-enables `use_llm_reasoning=True`.
 
 from __future__ import annotations
 
+import math
 import os
 from dataclasses import dataclass, field
 from datetime import UTC, date, datetime
@@ -57,7 +58,8 @@ class PeriodSpend:
 
     @property
     def total_cost_usd(self) -> float:
-        return sum(b.cost_usd for b in self.buckets.values())
+        # fsum: exact float total, independent of bucket insertion order.
+        return math.fsum(b.cost_usd for b in self.buckets.values())
 
     @property
     def total_input_tokens(self) -> int:
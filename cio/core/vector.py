@@ -134,5 +134,5 @@ class MockVectorClient:
 
     async def upsert(self, strategy_id: str, payload: dict[str, Any]) -> bool:
         self._storage.append({"strategy_id": strategy_id, **payload})
-        logger.debug(f"Mock Vector Upsert: {strategy_id}")
+        logger.debug("Mock Vector Upsert: %s", strategy_id)
         return True
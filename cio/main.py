@@ -5,7 +5,7 @@ import signal
 import sys
 
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from nats.aio.client import Client as NATS
 
 from cio.apps.authority_api import router as authority_router
@@ -14,6 +14,7 @@ from cio.apps.lifecycle_api import router as lifecycle_router
 from cio.apps.nurse.enforcer import NurseEnforcer
 from cio.apps.state_api import router as state_router
 from cio.clients.factory import ClientFactory
+from cio.core.alerting.manager import AlertManager
 from cio.core.alerts_consumer import AlertsConsumer
 from cio.core.arbiter import SignalArbiter
 from cio.core.authority import AuthorityStore
@@ -88,17 +89,23 @@ app.state.decision_store = DecisionStore()
 app.include_router(dashboard_router)
 
 
+# Probe bodies are constant, so they are encoded once instead of being run
+# through the JSON encoder on every kubelet probe.
+_PROBE_OK = b'{"status":"ok"}'
+_PROBE_NATS_DISCONNECTED = b'{"status":"degraded","nats":"disconnected"}'
+
+
 @app.get("/health/liveness")
 async def liveness():
-    return {"status": "ok"}
+    return Response(content=_PROBE_OK, media_type="application/json")
 
 
 @app.get("/health/readiness")
 async def readiness():
     # Basic check for NATS connection
     if hasattr(app.state, "nats_client") and app.state.nats_client.is_connected:
-        return {"status": "ok"}
-    return {"status": "degraded", "nats": "disconnected"}
+        return Response(content=_PROBE_OK, media_type="application/json")
+    return Response(content=_PROBE_NATS_DISCONNECTED, media_type="application/json")
 
 
 def _enforce_prompt_context_contract() -> None:
@@ -127,16 +134,38 @@ def _enforce_prompt_context_contract() -> None:
     logger.info("Prompt-context contract validated for action_classifier_v1.yaml")
 
 
+def _otel_auto_init_enabled() -> bool:
+    """True unless ENABLE_OTEL is off or OTEL_NO_AUTO_INIT is set."""
+    enabled = os.getenv("ENABLE_OTEL", "true").lower() in ("true", "1", "yes")
+    no_auto_init = os.getenv("OTEL_NO_AUTO_INIT", "").lower() in (
+        "1",
+        "true",
+        "yes",
+        "on",
+    )
+    return enabled and not no_auto_init
+
+
+def _uvicorn_config(host: str, port: int) -> uvicorn.Config:
+    """Build the health/API server config.
+
+    log_level="warning" also caps uvicorn.access at WARNING, so per-request
+    access lines are dropped; API_ACCESS_LOG=true raises it back to INFO.
+    """
+    config = uvicorn.Config(app, host=host, port=port, log_level="warning")
+    if os.getenv("API_ACCESS_LOG", "false").lower() in ("true", "1", "yes"):
+        logging.getLogger("uvicorn.access").setLevel(logging.INFO)
+    return config
+
+
 async def main():
     # 0. Enforce prompt-context contract before any service wiring (P1.4-AC3).
     _enforce_prompt_context_contract()
 
+    otel_enabled = _otel_auto_init_enabled()
+
     # 1. Setup OpenTelemetry
-    if (
-        os.getenv("ENABLE_OTEL", "true").lower() in ("true", "1", "yes")
-        and setup_telemetry
-        and os.getenv("OTEL_NO_AUTO_INIT", "").lower() not in ("1", "true", "yes", "on")
-    ):
+    if otel_enabled and setup_telemetry:
         try:
             logger.info("Initializing OpenTelemetry for CIO")
             setup_telemetry(
@@ -148,11 +177,7 @@ async def main():
             logger.warning(f"Failed to initialize OpenTelemetry: {e}")
 
     # 3. Attach OTel logging handler LAST (after logging is configured)
-    if (
-        os.getenv("ENABLE_OTEL", "true").lower() in ("true", "1", "yes")
-        and attach_logging_handler
-        and os.getenv("OTEL_NO_AUTO_INIT", "").lower() not in ("1", "true", "yes", "on")
-    ):
+    if otel_enabled and attach_logging_handler:
         try:
             success = attach_logging_handler()
             if success:
@@ -306,8 +331,7 @@ async def main():
     # 5. Run Health Check Server in background
     api_port = int(os.getenv("API_PORT", "8000"))
     api_host = os.getenv("API_HOST", "0.0.0.0")  # nosec
-    config = uvicorn.Config(app, host=api_host, port=api_port, log_level="warning")  # nosec
-    server = uvicorn.Server(config)
+    server = uvicorn.Server(_uvicorn_config(api_host, api_port))
 
     # Run uvicorn in a way that it doesn't block the main event loop entirely
     # or rather, run it as a task.
@@ -327,6 +351,7 @@ async def main():
     await listener.stop()
     await router.close()
     await builder.close()
+    await AlertManager.aclose()
     await redis_client.close()
     await nc.close()
 
@@ -342,8 +367,24 @@ async def main():
     logger.info("CIO Strategist shutdown complete.")
 
 
-if __name__ == "__main__":
+def run() -> None:
+    """Process entry point. Runs on uvloop (shipped with uvicorn[standard])
+    when it is installed, falling back to the default asyncio loop.
+
+    Uses uvloop.new_event_loop rather than uvloop.run, which only exists in
+    uvloop >= 0.18 while uvicorn[standard] allows >= 0.15.1.
+    """
     try:
+        import uvloop
+    except ImportError:
         asyncio.run(main())
+    else:
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            runner.run(main())
+
+
+if __name__ == "__main__":
+    try:
+        run()
     except KeyboardInterrupt:
         pass
@@ -3,14 +3,22 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import contextlib
 import os
+import stat
+import sys
 from collections.abc import Awaitable, Callable
-from functools import wraps
+from functools import partial, wraps
 from typing import Any
 
+import orjson
+
 from cio.core.rate_governor import RateGovernor
 
+# Upper bound for a single stdio JSON-RPC request line. Longer lines are
+# discarded unparsed and answered with an "Invalid Request" error.
+MAX_REQUEST_BYTES = 1_048_576
+
 # --- QUARANTINE BLOCK (Fix 2c) ---
 try:
     from core.config_manager import ConfigManager
@@ -47,6 +55,18 @@ except ImportError:
     LLM_AVAILABLE = False
 
 
+_REQUEST_TOO_LARGE = (
+    orjson.dumps(
+        {
+            "jsonrpc": "2.0",
+            "id": None,
+            "error": {"code": -32600, "message": "request too large"},
+        }
+    )
+    + b"\n"
+)
+
+
 def validate_thought_trace(
     fn: Callable[..., Awaitable[dict[str, Any]]],
 ) -> Callable[..., Awaitable[dict[str, Any]]]:
@@ -93,6 +113,7 @@ class MCPServer:
                 use_llm = False
         self._llm_client = llm_client
         self._use_llm = use_llm
+        self._stdin_feeder: asyncio.Task | None = None
         self.tools.append(
             {
                 "name": "rollback_to_version",
@@ -157,6 +178,36 @@ class MCPServer:
                 }
             )
         self.tools_by_name = {tool["name"]: tool for tool in self.tools}
+        self._tool_handlers = self._build_tool_handlers()
+        # Write tools gated by the Rate Governor (set_* or rollback).
+        self._throttled_tools = frozenset(
+            name
+            for name in self.tools_by_name
+            if name.startswith("set_") or name == "rollback_to_version"
+        )
+
+    def _build_tool_handlers(
+        self,
+    ) -> dict[str, Callable[..., Awaitable[dict[str, Any]]]]:
+        """Resolve each registered tool to its handler once, at startup.
+
+        Every handler is invoked as ``handler(arguments=...)``.
+        """
+        handlers: dict[str, Callable[..., Awaitable[dict[str, Any]]]] = {}
+        for name in self.tools_by_name:
+            if name == "get_earnings_summary":
+                handlers[name] = self._handle_earnings_summary
+            elif name.startswith("get_"):
+                handlers[name] = partial(self._handle_get, name)
+            elif name == "search_knowledge_base":
+                handlers[name] = self._handle_search_knowledge_base
+            elif name.startswith("set_"):
+                handlers[name] = partial(self._handle_set, name)
+            elif name == "rollback_to_version":
+                handlers[name] = self._handle_rollback
+            elif name == "llm_reasoning":
+                handlers[name] = self._handle_llm_reasoning
+        return handlers
 
     async def handle_request(self, request: dict[str, Any]) -> dict[str, Any]:
         method = request.get("method")
@@ -189,9 +240,7 @@ class MCPServer:
             raise ValueError(f"unknown tool: {tool_name}")
 
         # Check Rate Governor for "write" operations (set_* or rollback)
-        if (
-            tool_name.startswith("set_") or tool_name == "rollback_to_version"
-        ) and self.rate_governor.is_throttled():
+        if tool_name in self._throttled_tools and self.rate_governor.is_throttled():
             status = self.rate_governor.get_status()
             return {
                 "content": [
@@ -204,23 +253,17 @@ class MCPServer:
                 "isError": True,
             }
 
-        if tool_name.startswith("get_"):
-            if tool_name == "get_earnings_summary":
-                return await self._handle_earnings_summary(arguments=arguments)
-            return await self._handle_get(tool_name)
-        if tool_name == "search_knowledge_base":
-            return await self._handle_search_knowledge_base(arguments=arguments)
-
-        if tool_name.startswith("set_"):
-            return await self._handle_set(tool_name, arguments=arguments)
-        if tool_name == "rollback_to_version":
-            return await self._handle_rollback(arguments=arguments)
-        if tool_name == "llm_reasoning":
-            return await self._handle_llm_reasoning(arguments=arguments)
-
-        raise ValueError(f"unsupported tool: {tool_name}")
+        handler = self._tool_handlers.get(tool_name)
+        if handler is None:
+            raise ValueError(f"unsupported tool: {tool_name}")
+        return await handler(arguments=arguments)
 
-    async def _handle_get(self, tool_name: str) -> dict[str, Any]:
+    async def _handle_get(
+        self,
+        tool_name: str,
+        *,
+        arguments: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
         model_name = tool_name.removeprefix("get_")
         return {
             "model": model_name,
@@ -308,21 +351,79 @@ class MCPServer:
         validated = model(**payload)
         return validated.model_dump()
 
+    async def _open_stdin_reader(self) -> asyncio.StreamReader:
+        """Attach an asyncio StreamReader to stdin so lines are read on the loop.
+
+        Pipe transports reject regular files (``< requests.jsonl``), so those
+        are fed into the reader from a worker thread instead.
+        """
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader(limit=MAX_REQUEST_BYTES)
+        if stat.S_ISREG(os.fstat(sys.stdin.fileno()).st_mode):
+            self._stdin_feeder = asyncio.create_task(
+                self._feed_from_file(reader, sys.stdin.buffer)
+            )
+            return reader
+        protocol = asyncio.StreamReaderProtocol(reader)
+        await loop.connect_read_pipe(lambda: protocol, sys.stdin)
+        return reader
+
+    @staticmethod
+    async def _feed_from_file(reader: asyncio.StreamReader, stream: Any) -> None:
+        try:
+            while chunk := await asyncio.to_thread(stream.read1, 65536):
+                reader.feed_data(chunk)
+        finally:
+            reader.feed_eof()
+
+    @staticmethod
+    async def _read_request_line(reader: asyncio.StreamReader) -> bytes | None:
+        """Read one request line; ``b""`` means EOF, ``None`` an oversized line.
+
+        Oversized lines are drained up to their newline without ever being
+        buffered whole, so one bad client can't stall the loop in a parse.
+        """
+        discarding = False
+        while True:
+            try:
+                line = await reader.readuntil(b"\n")
+            except asyncio.IncompleteReadError as exc:
+                return None if discarding else exc.partial
+            except asyncio.LimitOverrunError as exc:
+                await reader.readexactly(exc.consumed)
+                discarding = True
+                continue
+            return None if discarding else line
+
     async def run_stdio(self) -> None:
         """Run JSON-RPC loop over stdin/stdout (one JSON request per line)."""
         # Start rate governor
         await self.rate_governor.start()
 
         try:
+            reader = await self._open_stdin_reader()
+            stdout = sys.stdout.buffer
             while True:
-                line = await asyncio.to_thread(input)
+                line = await self._read_request_line(reader)
+                if line is None:
+                    stdout.write(_REQUEST_TOO_LARGE)
+                    stdout.flush()
+                    continue
                 if not line:
+                    break  # EOF — client closed stdin
+                if not line.strip():
                     continue
 
-                request = json.loads(line)
+                request = orjson.loads(line)
                 response = await self.handle_request(request)
-                print(json.dumps(response), flush=True)
+                stdout.write(orjson.dumps(response) + b"\n")
+                stdout.flush()
         finally:
+            feeder, self._stdin_feeder = self._stdin_feeder, None
+            if feeder is not None:
+                feeder.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await feeder
             # Stop rate governor
             await self.rate_governor.stop()
 
@@ -6,6 +6,9 @@ from typing import Any
 
 from core.db.vector_client import VectorMemoryClient
 
+# Payload keys checked, in priority order, for an audit's PnL estimate.
+_PNL_KEYS: tuple[str, ...] = ("potential_pnl", "expected_pnl", "estimated_pnl")
+
 
 class InstitutionalMemoryService:
     """Indexes thought traces and provides semantic retrieval."""
@@ -55,10 +58,14 @@ class InstitutionalMemoryService:
     @staticmethod
     def _extract_pnl_impact(audit_document: dict[str, Any]) -> float:
         payload = audit_document.get("payload") or {}
-        for key in ("potential_pnl", "expected_pnl", "estimated_pnl"):
-            if key in payload:
-                try:
-                    return float(payload[key])
-                except (TypeError, ValueError):
-                    continue
+        for key in _PNL_KEYS:
+            value = payload.get(key)
+            if value is None:
+                continue
+            if type(value) is float:
+                return value
+            try:
+                return float(value)
+            except (TypeError, ValueError):
+                continue
         return 0.0
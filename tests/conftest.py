@@ -32,6 +32,18 @@ def mock_redis_cache():
     mock = MagicMock()
     mock.get = AsyncMock(return_value=None)
     mock.set = AsyncMock()
+
+    # Batched helpers route through get/set (looked up at call time) so tests
+    # that swap or assert on get/set keep working.
+    async def _get_many(keys):
+        return [await mock.get(key) for key in keys]
+
+    async def _set_many(items):
+        for key, (value, ttl) in items.items():
+            await mock.set(key, value, ttl=ttl)
+
+    mock.get_many = AsyncMock(side_effect=_get_many)
+    mock.set_many = AsyncMock(side_effect=_set_many)
     return mock
 
 
@@ -1,3 +1,4 @@
+import smtplib
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -49,6 +50,20 @@ async def test_redundant_dispatcher_partial_failure():
     assert success is True
 
 
+@pytest.mark.asyncio
+async def test_redundant_dispatcher_aclose_closes_every_channel():
+    """Shutdown reaches every channel even if one of them fails to close."""
+    dispatcher = RedundantAlertDispatcher()
+    grafana, otel, email = (MagicMock(aclose=AsyncMock()) for _ in range(3))
+    otel.aclose.side_effect = RuntimeError("close failed")
+    dispatcher.channels = [grafana, otel, email]
+
+    await dispatcher.aclose()
+
+    for channel in (grafana, otel, email):
+        channel.aclose.assert_awaited_once()
+
+
 @pytest.mark.asyncio
 async def test_grafana_channel_http_call():
     """Test GrafanaChannel HTTP API call."""
@@ -68,6 +83,31 @@ async def test_grafana_channel_http_call():
             assert kwargs["json"]["text"] == "Test Grafana"
 
 
+@pytest.mark.asyncio
+async def test_grafana_channel_reuses_http_client():
+    """Consecutive alerts go through one pooled client with the auth header set."""
+    with (
+        patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post,
+        patch.dict(
+            "os.environ",
+            {"GRAFANA_API_URL": "http://grafana", "GRAFANA_API_KEY": "key"},
+        ),
+    ):
+        mock_post.return_value.status_code = 200
+        channel = GrafanaChannel()
+
+        await channel.send("first", {})
+        client = channel._client
+        await channel.send("second", {})
+
+        assert channel._client is client
+        assert client.headers["Authorization"] == "Bearer key"
+        assert mock_post.await_count == 2
+
+        await channel.aclose()
+        assert channel._client is None
+
+
 @pytest.mark.asyncio
 async def test_otel_channel_span():
     """Test OtelChannel creates a span."""
@@ -90,8 +130,7 @@ async def test_otel_channel_span():
 async def test_email_channel_smtp():
     """Test EmailChannel SMTP call."""
     with patch("smtplib.SMTP") as mock_smtp:
-        mock_server = MagicMock()
-        mock_smtp.return_value.__enter__.return_value = mock_server
+        mock_server = mock_smtp.return_value
 
         with patch.dict(
             "os.environ",
@@ -105,6 +144,83 @@ async def test_email_channel_smtp():
             channel = EmailChannel()
             await channel.send("Test Email", {"alert_type": "RED"})
 
+            mock_smtp.assert_called_once_with("host", 587, timeout=10.0)
             mock_server.starttls.assert_called_once()
             mock_server.login.assert_called_once_with("user", "pass")
             mock_server.send_message.assert_called_once()
+
+
+_SMTP_ENV = {"SMTP_USER": "user", "SMTP_PASS": "pass", "SMTP_HOST": "host"}
+
+
+@pytest.mark.asyncio
+async def test_email_channel_reuses_smtp_connection():
+    """Consecutive alerts share one authenticated SMTP session."""
+    with (
+        patch("smtplib.SMTP") as mock_smtp,
+        patch.dict("os.environ", _SMTP_ENV),
+    ):
+        mock_smtp.return_value.noop.return_value = (250, b"OK")
+        channel = EmailChannel()
+        assert await channel.send("first", {}) is True
+        assert await channel.send("second", {}) is True
+
+        mock_smtp.assert_called_once()
+        mock_smtp.return_value.login.assert_called_once()
+        assert mock_smtp.return_value.send_message.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_email_channel_reconnects_after_server_disconnect():
+    """An idle-timeout disconnect is retried once on a fresh connection."""
+    stale, fresh = MagicMock(), MagicMock()
+    stale.noop.return_value = (250, b"OK")
+    stale.send_message.side_effect = smtplib.SMTPServerDisconnected("idle")
+    with (
+        patch("smtplib.SMTP", side_effect=[fresh]) as mock_smtp,
+        patch.dict("os.environ", _SMTP_ENV),
+    ):
+        channel = EmailChannel()
+        channel._smtp = stale
+
+        assert await channel.send("after idle", {}) is True
+
+        mock_smtp.assert_called_once()
+        fresh.send_message.assert_called_once()
+        assert channel._smtp is fresh
+
+
+@pytest.mark.asyncio
+async def test_email_channel_drops_session_that_fails_noop():
+    """A dead cached session is replaced before any send is attempted on it."""
+    stale, fresh = MagicMock(), MagicMock()
+    stale.noop.side_effect = smtplib.SMTPServerDisconnected("half-open")
+    with (
+        patch("smtplib.SMTP", side_effect=[fresh]) as mock_smtp,
+        patch.dict("os.environ", _SMTP_ENV),
+    ):
+        channel = EmailChannel()
+        channel._smtp = stale
+
+        assert await channel.send("after outage", {}) is True
+
+        mock_smtp.assert_called_once_with("host", 587, timeout=10.0)
+        stale.send_message.assert_not_called()
+        fresh.send_message.assert_called_once()
+        assert channel._smtp is fresh
+
+
+@pytest.mark.asyncio
+async def test_email_channel_aclose_quits_cached_session():
+    with (
+        patch("smtplib.SMTP") as mock_smtp,
+        patch.dict("os.environ", _SMTP_ENV),
+    ):
+        mock_smtp.return_value.noop.return_value = (250, b"OK")
+        channel = EmailChannel()
+        assert await channel.send("before shutdown", {}) is True
+
+        await channel.aclose()
+
+        mock_smtp.return_value.quit.assert_called_once()
+        assert channel._smtp is None
@@ -6,6 +6,7 @@ import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from prometheus_client import REGISTRY
 
 from cio.core.alerting.telegram_channel import TelegramChannel
 from cio.core.alerts_consumer import (
@@ -46,10 +47,9 @@ async def test_telegram_send_returns_true_on_http_200():
     mock_resp.status_code = 200
 
     with patch("httpx.AsyncClient") as mock_client_cls:
-        mock_client = AsyncMock()
+        mock_client = mock_client_cls.return_value
+        mock_client.is_closed = False
         mock_client.post = AsyncMock(return_value=mock_resp)
-        mock_client_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client_cls.return_value.__aexit__ = AsyncMock(return_value=False)
 
         result = await ch.send("test message")
 
@@ -68,10 +68,9 @@ async def test_telegram_send_returns_false_on_non_200():
     mock_resp.text = "Bad Request"
 
     with patch("httpx.AsyncClient") as mock_client_cls:
-        mock_client = AsyncMock()
+        mock_client = mock_client_cls.return_value
+        mock_client.is_closed = False
         mock_client.post = AsyncMock(return_value=mock_resp)
-        mock_client_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client_cls.return_value.__aexit__ = AsyncMock(return_value=False)
 
         result = await ch.send("test")
 
@@ -83,16 +82,37 @@ async def test_telegram_send_returns_false_on_network_error():
     ch = TelegramChannel(bot_token="tok", chat_id="123")
 
     with patch("httpx.AsyncClient") as mock_client_cls:
-        mock_client = AsyncMock()
+        mock_client = mock_client_cls.return_value
+        mock_client.is_closed = False
         mock_client.post = AsyncMock(side_effect=Exception("connection refused"))
-        mock_client_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client_cls.return_value.__aexit__ = AsyncMock(return_value=False)
 
         result = await ch.send("test")
 
     assert result is False
 
 
+@pytest.mark.asyncio
+async def test_telegram_reuses_one_client_until_closed():
+    ch = TelegramChannel(bot_token="tok", chat_id="123")
+    mock_resp = MagicMock()
+    mock_resp.status_code = 200
+
+    with patch("httpx.AsyncClient") as mock_client_cls:
+        mock_client = mock_client_cls.return_value
+        mock_client.is_closed = False
+        mock_client.post = AsyncMock(return_value=mock_resp)
+        mock_client.aclose = AsyncMock()
+
+        assert await ch.send("first") is True
+        assert await ch.send("second") is True
+        await ch.aclose()
+
+    mock_client_cls.assert_called_once_with(timeout=10.0)
+    assert mock_client.post.await_count == 2
+    mock_client.aclose.assert_awaited_once()
+    assert ch._client is None
+
+
 @pytest.mark.asyncio
 async def test_telegram_reads_env_vars(monkeypatch):
     monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "envtok")
@@ -188,6 +208,7 @@ async def test_alerts_consumer_stop_unsubscribes():
     await consumer.stop()
 
     mock_sub.unsubscribe.assert_awaited_once()
+    telegram.aclose.assert_awaited_once()
 
 
 @pytest.mark.asyncio
@@ -274,3 +295,33 @@ async def test_alerts_consumer_survives_telegram_exception():
         pytest.fail(
             "AlertsConsumer._handle_message must not propagate telegram exceptions"
         )
+
+
+def _forwarded_count(result: str) -> float:
+    return (
+        REGISTRY.get_sample_value(
+            "cio_alerts_consumer_forwarded_total", {"result": result}
+        )
+        or 0.0
+    )
+
+
+@pytest.mark.asyncio
+async def test_alerts_consumer_counts_forward_results():
+    nc = _make_nats_client()
+    telegram = AsyncMock(spec=TelegramChannel)
+    telegram.is_configured = True
+    telegram.send = AsyncMock(side_effect=[True, False])
+    consumer = AlertsConsumer(nats_client=nc, telegram=telegram)
+    before = {r: _forwarded_count(r) for r in ("ok", "failed", "parse_error")}
+
+    await consumer._handle_message(_make_nats_msg("alerts.a.b", {"message": "1"}))
+    await consumer._handle_message(_make_nats_msg("alerts.a.b", {"message": "2"}))
+    bad = MagicMock()
+    bad.subject = "alerts.a.b"
+    bad.data = b"not-json"
+    await consumer._handle_message(bad)
+
+    assert _forwarded_count("ok") == before["ok"] + 1
+    assert _forwarded_count("failed") == before["failed"] + 1
+    assert _forwarded_count("parse_error") == before["parse_error"] + 1
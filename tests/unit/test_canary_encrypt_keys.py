@@ -0,0 +1,31 @@
+"""Tests for the in-process canary key encryption (canary/encrypt_keys.py)."""
+
+import shutil
+
+import pytest
+
+from canary.encrypt_keys import OPENSSL_MAGIC, encrypt_payload
+from canary.nuclear_option import decrypt_keys
+
+PAYLOAD = {"apiKey": "k", "secret": "s", "password": "", "testnet": True}
+
+
+def test_encrypt_payload_writes_openssl_salted_format(tmp_path):
+    out = tmp_path / "keys.json.enc"
+    encrypt_payload(PAYLOAD, "hunter2", str(out))
+
+    blob = out.read_bytes()
+    assert blob.startswith(OPENSSL_MAGIC)
+    # magic + 8-byte salt + whole AES blocks
+    assert (len(blob) - 16) % 16 == 0
+    assert b"secret" not in blob
+
+
+@pytest.mark.skipif(shutil.which("openssl") is None, reason="openssl CLI missing")
+def test_encrypt_payload_round_trips_through_openssl_cli(tmp_path):
+    out = tmp_path / "keys.json.enc"
+    encrypt_payload(PAYLOAD, "hunter2", str(out))
+
+    assert decrypt_keys(str(out), "hunter2") == PAYLOAD
+    with pytest.raises(ValueError):
+        decrypt_keys(str(out), "wrong")
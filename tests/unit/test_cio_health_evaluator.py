@@ -13,10 +13,12 @@ state, and the OutcomeCorrelator's persistence hook.
 
 from __future__ import annotations
 
+import asyncio
 import json
+import time
 from datetime import datetime, timedelta
 from types import SimpleNamespace
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -419,3 +421,34 @@ async def test_unparsable_decision_payload_dropped(evaluator):
     bad = SimpleNamespace(subject="cio.decision.audit.execute", data=b"not json")
     await evaluator._on_decision(bad)
     assert not evaluator._decisions
+
+
+# ---------------------------------------------------------------------------
+# Emit cadence
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_emit_loop_subtracts_tick_duration_from_sleep(mock_nats_client):
+    evaluator = CIOHealthEvaluator(
+        nats_client=mock_nats_client, emit_interval=timedelta(seconds=0.1)
+    )
+
+    def _slow_tick() -> None:
+        time.sleep(0.03)  # blocking on purpose: tick cost counts against the interval
+
+    sleeps: list[float] = []
+
+    async def _record_sleep(delay: float) -> None:
+        sleeps.append(delay)
+        raise asyncio.CancelledError
+
+    with (
+        patch.object(evaluator, "tick", AsyncMock(side_effect=_slow_tick)),
+        patch("cio.core.health_evaluator.asyncio.sleep", _record_sleep),
+        pytest.raises(asyncio.CancelledError),
+    ):
+        await evaluator._emit_loop()
+
+    assert len(sleeps) == 1
+    assert 0 <= sleeps[0] <= 0.08
@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -122,3 +123,84 @@ async def test_context_builder_handles_no_regime_data_in_metadata():
     assert "No regime data available" in result.thought_trace
 
     await builder.close()
+
+
+def _regime_response() -> MagicMock:
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = {
+        "pair": "BTCUSDT",
+        "metric": "regime",
+        "data": {
+            "regime": "bullish_acceleration",
+            "volatility_level": "medium",
+            "volume_level": "high",
+            "trend_direction": "up",
+            "confidence": "0.95",
+        },
+        "metadata": {"timestamp": "2026-03-08T17:00:00Z", "collection": "live"},
+    }
+    return mock_response
+
+
+@pytest.mark.asyncio
+async def test_context_builder_caches_regime_per_symbol():
+    """Successful regime reads are reused within the TTL window."""
+    builder = ContextBuilder(
+        data_manager_url="http://dm",
+        tradeengine_url="http://te",
+        regime_cache_ttl_seconds=60.0,
+    )
+    builder.client.get = AsyncMock(return_value=_regime_response())
+
+    first = await builder._fetch_regime("BTCUSDT", "cid-1")
+    second = await builder._fetch_regime("BTCUSDT", "cid-2")
+
+    assert first is second
+    assert first.regime == RegimeEnum.TRENDING_BULL
+    builder.client.get.assert_awaited_once()
+
+    await builder.close()
+
+
+@pytest.mark.asyncio
+async def test_context_builder_regime_cache_disabled_with_zero_ttl():
+    builder = ContextBuilder(
+        data_manager_url="http://dm",
+        tradeengine_url="http://te",
+        regime_cache_ttl_seconds=0,
+    )
+    builder.client.get = AsyncMock(return_value=_regime_response())
+
+    await builder._fetch_regime("BTCUSDT", "cid-1")
+    await builder._fetch_regime("BTCUSDT", "cid-2")
+
+    assert builder.client.get.await_count == 2
+
+    await builder.close()
+
+
+@pytest.mark.asyncio
+async def test_context_builder_coalesces_concurrent_regime_fetches():
+    """Overlapping misses for one symbol share a single data-manager request."""
+    builder = ContextBuilder(
+        data_manager_url="http://dm",
+        tradeengine_url="http://te",
+        regime_cache_ttl_seconds=0,
+    )
+
+    async def _slow_get(url):
+        await asyncio.sleep(0.01)
+        return _regime_response()
+
+    builder.client.get = AsyncMock(side_effect=_slow_get)
+
+    results = await asyncio.gather(
+        *(builder._fetch_regime("BTCUSDT", f"cid-{i}") for i in range(5))
+    )
+
+    builder.client.get.assert_awaited_once()
+    assert all(r.regime == RegimeEnum.TRENDING_BULL for r in results)
+    assert builder._regime_inflight == {}
+
+    await builder.close()
@@ -87,3 +87,124 @@ async def test_heartbeat_responder_stop_with_sid():
     await responder.stop()
     mock_nc.unsubscribe.assert_called_once_with(123)
     assert responder.subscription is None
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_publisher_stop_does_not_wait_for_interval():
+    """stop() wakes the loop instead of sleeping out a long interval."""
+    mock_nc = AsyncMock()
+    publisher = HeartbeatPublisher(mock_nc, interval_seconds=30.0)
+
+    await publisher.start("test.heartbeat")
+    await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(publisher.stop(), timeout=1.0)
+    assert publisher.task is None
+    mock_nc.publish.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_publisher_keeps_interval_after_failure():
+    """A failed publish is retried on the normal interval, not backed off."""
+    mock_nc = AsyncMock()
+    mock_nc.publish.side_effect = [ConnectionError("nats down"), None, None]
+    publisher = HeartbeatPublisher(mock_nc, interval_seconds=0.01)
+
+    await publisher.start()
+    for _ in range(100):
+        if mock_nc.publish.call_count >= 2:
+            break
+        await asyncio.sleep(0.01)
+    await publisher.stop()
+
+    assert mock_nc.publish.call_count >= 2
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_responder_checks_dependencies_concurrently():
+    """Redis and Mongo checks overlap, and a failure reports DEGRADED."""
+    mock_nc = AsyncMock()
+    redis_started, mongo_started = asyncio.Event(), asyncio.Event()
+
+    # Each check waits for the other to start, so sequential checks would
+    # time out and report DEGRADED.
+    async def _redis_ping():
+        redis_started.set()
+        await mongo_started.wait()
+        return True
+
+    async def _mongo_ping(*_args):
+        mongo_started.set()
+        await redis_started.wait()
+        return {"ok": 1}
+
+    redis = MagicMock()
+    redis.ping = AsyncMock(side_effect=_redis_ping)
+    mongo = MagicMock()
+    mongo.admin.command = AsyncMock(side_effect=_mongo_ping)
+    responder = HeartbeatResponder(
+        mock_nc, redis_client=redis, mongo_client=mongo, check_timeout_seconds=1.0
+    )
+
+    mock_msg = MagicMock()
+    mock_msg.reply = "reply_subject"
+    await responder._handle_ping(mock_msg)
+
+    response = json.loads(mock_nc.publish.call_args.args[1].decode())
+    assert response["status"] == "GOVERNANCE_ACTIVE"
+    assert response["health"]["redis"] is True
+    assert response["health"]["mongodb"] is True
+    mongo.admin.command.assert_awaited_once_with("ping")
+
+    redis.ping = AsyncMock(side_effect=ConnectionError("down"))
+    await responder._handle_ping(mock_msg)
+
+    response = json.loads(mock_nc.publish.call_args.args[1].decode())
+    assert response["status"] == "DEGRADED"
+    assert response["health"]["redis"] is False
+    assert response["health"]["mongodb"] is True
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_responder_reports_hung_dependency_as_degraded():
+    mock_nc = AsyncMock()
+
+    async def _hang():
+        await asyncio.Event().wait()
+
+    redis = MagicMock()
+    redis.ping = AsyncMock(side_effect=_hang)
+    responder = HeartbeatResponder(
+        mock_nc, redis_client=redis, check_timeout_seconds=0.01
+    )
+
+    mock_msg = MagicMock()
+    mock_msg.reply = "reply_subject"
+    await responder._handle_ping(mock_msg)
+
+    response = json.loads(mock_nc.publish.call_args.args[1].decode())
+    assert response["status"] == "DEGRADED"
+    assert response["health"]["redis"] is False
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_responder_slow_dependency_is_over_budget_not_degraded():
+    """A connected-but-slow dependency misses the reply budget, not governance."""
+    mock_nc = AsyncMock()
+
+    async def _slow_ping():
+        await asyncio.sleep(0.03)
+        return True
+
+    redis = MagicMock()
+    redis.ping = AsyncMock(side_effect=_slow_ping)
+    responder = HeartbeatResponder(mock_nc, redis_client=redis)
+
+    mock_msg = MagicMock()
+    mock_msg.reply = "reply_subject"
+    await responder._handle_ping(mock_msg)
+
+    response = json.loads(mock_nc.publish.call_args.args[1].decode())
+    assert response["status"] == "GOVERNANCE_ACTIVE"
+    assert response["health"]["redis"] is True
+    assert response["health"]["under_budget"] is False
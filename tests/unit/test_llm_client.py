@@ -4,6 +4,7 @@ Unit tests for LiteLLMClient fixes:
   - AC1: response_format=json_object only when supported/configured
 """
 
+import asyncio
 import logging
 import os
 import sys
@@ -486,6 +487,22 @@ def test_env_bool_variants():
         assert llm_client_module._env_bool("EB", default=False) is True
 
 
+def test_latency_kwargs_only_when_optimized_and_direct():
+    latency_kwargs = llm_client_module._latency_kwargs
+    with patch.dict(os.environ, {}, clear=True):
+        assert latency_kwargs("openai/gpt-4o-mini", None) == {}
+    with patch.dict(os.environ, {"LLM_LATENCY_MODE": "optimized"}, clear=True):
+        assert latency_kwargs("bedrock/anthropic.claude-3-haiku", None) == {
+            "performanceConfig": {"latency": "optimized"}
+        }
+        assert latency_kwargs("openai/gpt-4o-mini", None) == {
+            "service_tier": "priority"
+        }
+        assert latency_kwargs("anthropic/claude-3-haiku-20240307", None) == {}
+        # Proxied routes never get vendor-specific knobs.
+        assert latency_kwargs("openai/gpt-4o-mini", "https://proxy/v1") == {}
+
+
 @pytest.mark.asyncio
 async def test_circuit_breaker_open_skips_litellm():
     client = LiteLLMClient()
@@ -538,6 +555,29 @@ async def test_primary_raises_fallback_succeeds():
     assert fake_litellm.acompletion.await_count == 2
 
 
+@pytest.mark.asyncio
+async def test_complete_returns_error_for_unserialisable_context():
+    """A context json.dumps rejects becomes an error response, not a raise."""
+    client = LiteLLMClient()
+    fake_litellm = SimpleNamespace(
+        acompletion=AsyncMock(side_effect=AssertionError("should not call")),
+        get_supported_openai_params=MagicMock(return_value=[]),
+    )
+    fake_exceptions = SimpleNamespace(
+        RateLimitError=RuntimeError,
+        ServiceUnavailableError=RuntimeError,
+    )
+    with patch.dict(
+        sys.modules,
+        {"litellm": fake_litellm, "litellm.exceptions": fake_exceptions},
+    ):
+        out = await client.complete("p", "s", {"historical_context": object()})
+
+    assert out.error.startswith("Invalid user context:")
+    assert out.content == ""
+    fake_litellm.acompletion.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_embed_success_returns_vector():
     client = LiteLLMClient()
@@ -761,3 +801,66 @@ async def test_fallback_defaults_to_primary_api_base_when_env_unset():
         "Without LLM_FALLBACK_API_BASE, all calls must use the primary api_base"
     )
     assert result.error is None
+
+
+@pytest.mark.asyncio
+async def test_complete_respects_max_inflight_limit():
+    """LLM_MAX_INFLIGHT caps concurrent provider requests per client."""
+    with patch.dict(os.environ, {"LLM_MAX_INFLIGHT": "2"}):
+        client = LiteLLMClient()
+
+    active = 0
+    peak = 0
+
+    async def _acompletion(**_kwargs):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return _mock_litellm_response('{"ok":true}')
+
+    fake_litellm = SimpleNamespace(
+        get_supported_openai_params=MagicMock(return_value=[]),
+        acompletion=AsyncMock(side_effect=_acompletion),
+    )
+    fake_exceptions = SimpleNamespace(
+        RateLimitError=RuntimeError,
+        ServiceUnavailableError=RuntimeError,
+    )
+    with patch.dict(
+        sys.modules,
+        {"litellm": fake_litellm, "litellm.exceptions": fake_exceptions},
+    ):
+        results = await asyncio.gather(
+            *(client.complete("p", "s", {"i": i}) for i in range(6))
+        )
+
+    assert all(r.error is None for r in results)
+    assert fake_litellm.acompletion.await_count == 6
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_complete_passes_latency_knobs_when_optimized():
+    client = LiteLLMClient()
+    fake_litellm = SimpleNamespace(
+        get_supported_openai_params=MagicMock(return_value=[]),
+        acompletion=AsyncMock(return_value=_mock_litellm_response('{"ok":true}')),
+    )
+    fake_exceptions = SimpleNamespace(
+        RateLimitError=RuntimeError,
+        ServiceUnavailableError=RuntimeError,
+    )
+    env = {"LLM_LATENCY_MODE": "optimized", "LLM_MODEL": "openai/gpt-4o-mini"}
+    with (
+        patch.dict(os.environ, env, clear=True),
+        patch.dict(
+            sys.modules,
+            {"litellm": fake_litellm, "litellm.exceptions": fake_exceptions},
+        ),
+    ):
+        out = await client.complete("p", "s", {})
+
+    assert out.error is None
+    assert fake_litellm.acompletion.call_args.kwargs["service_tier"] == "priority"
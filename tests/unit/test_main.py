@@ -1,3 +1,4 @@
+import logging
 import os
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -77,3 +78,109 @@ async def test_nats_subscription_with_wildcard():
         # Verify that the listener was started with the correct subject
         # cio.main.py appends .> if it's missing (following Petrosa NATS contract)
         mock_nats_listener.start.assert_called_once_with(subject="cio.intent.trading.>")
+
+
+def test_health_probes_return_pre_encoded_json():
+    from fastapi.testclient import TestClient
+
+    from cio.main import app
+
+    client = TestClient(app)
+
+    live = client.get("/health/liveness")
+    assert live.status_code == 200
+    assert live.headers["content-type"] == "application/json"
+    assert live.json() == {"status": "ok"}
+
+    nats_client = MagicMock(is_connected=False)
+    with patch.object(app.state, "nats_client", nats_client, create=True):
+        assert client.get("/health/readiness").json() == {
+            "status": "degraded",
+            "nats": "disconnected",
+        }
+        nats_client.is_connected = True
+        assert client.get("/health/readiness").json() == {"status": "ok"}
+
+
+def test_run_uses_uvloop_when_available():
+    pytest.importorskip("uvloop")
+    import asyncio
+    import sys
+
+    import cio.main as cio_main
+
+    loop_types = []
+
+    async def _fake_main():
+        loop_types.append(type(asyncio.get_running_loop()).__module__)
+
+    with patch.object(cio_main, "main", _fake_main):
+        cio_main.run()
+        with patch.dict(sys.modules, {"uvloop": None}):
+            cio_main.run()
+
+    assert loop_types[0].startswith("uvloop")
+    assert loop_types[1].startswith("asyncio")
+
+
+def test_run_does_not_need_uvloop_run():
+    """Older uvloop releases (< 0.18) have no uvloop.run."""
+    uvloop = pytest.importorskip("uvloop")
+    import asyncio
+    import sys
+    from types import SimpleNamespace
+
+    import cio.main as cio_main
+
+    loop_types = []
+
+    async def _fake_main():
+        loop_types.append(type(asyncio.get_running_loop()).__module__)
+
+    old_uvloop = SimpleNamespace(new_event_loop=uvloop.new_event_loop)
+    with (
+        patch.object(cio_main, "main", _fake_main),
+        patch.dict(sys.modules, {"uvloop": old_uvloop}),
+    ):
+        cio_main.run()
+
+    assert loop_types[0].startswith("uvloop")
+
+
+@pytest.mark.parametrize(
+    "env, expected",
+    [
+        ({}, True),
+        ({"ENABLE_OTEL": "false"}, False),
+        ({"OTEL_NO_AUTO_INIT": "on"}, False),
+    ],
+)
+def test_otel_auto_init_enabled(monkeypatch, env, expected):
+    from cio.main import _otel_auto_init_enabled
+
+    monkeypatch.delenv("ENABLE_OTEL", raising=False)
+    monkeypatch.delenv("OTEL_NO_AUTO_INIT", raising=False)
+    for key, value in env.items():
+        monkeypatch.setenv(key, value)
+
+    assert _otel_auto_init_enabled() is expected
+
+
+@pytest.mark.parametrize(
+    "flag, expected_level", [(None, logging.WARNING), ("true", logging.INFO)]
+)
+def test_uvicorn_access_log_is_opt_in(monkeypatch, flag, expected_level):
+    from cio.main import _uvicorn_config
+
+    access_logger = logging.getLogger("uvicorn.access")
+    original_level = access_logger.level
+    monkeypatch.delenv("API_ACCESS_LOG", raising=False)
+    if flag is not None:
+        monkeypatch.setenv("API_ACCESS_LOG", flag)
+
+    try:
+        config = _uvicorn_config("127.0.0.1", 8000)
+        assert config.access_log is True
+        assert access_logger.level == expected_level
+    finally:
+        access_logger.setLevel(original_level)
@@ -1,5 +1,8 @@
-from unittest.mock import MagicMock, patch
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import orjson
 import pytest
 
 from cio.mcp_server import MCPServer
@@ -85,3 +88,193 @@ async def test_mcp_server_no_throttling_for_reads():
 
         assert "isError" not in result
         assert result["model"] == "test"
+
+
+@pytest.mark.asyncio
+async def test_mcp_server_dispatches_tools_through_handler_table():
+    """Registered tools resolve to their handler; unmapped tools are rejected."""
+    mock_config_manager = MagicMock()
+    mock_config_manager.set_config = AsyncMock(return_value={"audit_id": "a-1"})
+    mock_roi_engine = MagicMock()
+    mock_roi_engine.get_earnings_summary = AsyncMock(return_value={"pnl": 1.0})
+    mock_memory_service = MagicMock()
+
+    with (
+        patch("cio.mcp_server.discover_schema_models", return_value={}),
+        patch(
+            "cio.mcp_server.generate_tools",
+            return_value=[
+                {"name": "set_test", "mode": "write"},
+                {"name": "describe_test", "mode": "read"},
+            ],
+        ),
+        patch("cio.mcp_server.RateGovernor") as MockRateGovernor,
+    ):
+        MockRateGovernor.return_value.is_throttled.return_value = False
+
+        server = MCPServer(
+            config_manager=mock_config_manager,
+            roi_engine=mock_roi_engine,
+            memory_service=mock_memory_service,
+        )
+
+        result = await server._call_tool(
+            {
+                "name": "set_test",
+                "arguments": {"payload": {"a": 1}, "thought_trace": "x" * 101},
+            }
+        )
+        assert result == {
+            "model": "test",
+            "updated": True,
+            "audit": {"audit_id": "a-1"},
+        }
+
+        result = await server._call_tool(
+            {"name": "get_earnings_summary", "arguments": {"window_hours": 2}}
+        )
+        assert result == {"pnl": 1.0}
+        mock_roi_engine.get_earnings_summary.assert_awaited_once_with(window_hours=2)
+
+        with pytest.raises(ValueError, match="unsupported tool"):
+            await server._call_tool({"name": "describe_test", "arguments": {}})
+
+
+def _stdin_reader(data: bytes, limit: int = 2**16) -> asyncio.StreamReader:
+    reader = asyncio.StreamReader(limit=limit)
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+@pytest.mark.asyncio
+async def test_mcp_server_run_stdio_serves_lines_until_eof(capsys):
+    """run_stdio answers each request line from the stdin reader and exits on EOF."""
+    with (
+        patch("cio.mcp_server.discover_schema_models", return_value={}),
+        patch("cio.mcp_server.generate_tools", return_value=[]),
+        patch("cio.mcp_server.RateGovernor") as MockRateGovernor,
+    ):
+        MockRateGovernor.return_value.start = AsyncMock()
+        MockRateGovernor.return_value.stop = AsyncMock()
+
+        server = MCPServer(
+            config_manager=MagicMock(),
+            roi_engine=MagicMock(),
+            memory_service=MagicMock(),
+        )
+        requests = (
+            b'{"jsonrpc": "2.0", "id": 1, "method": "initialize"}\n'
+            b"\n"
+            b'{"jsonrpc": "2.0", "id": 2, "method": "nope"}\n'
+        )
+        with patch.object(
+            server,
+            "_open_stdin_reader",
+            AsyncMock(return_value=_stdin_reader(requests)),
+        ):
+            await server.run_stdio()
+
+        MockRateGovernor.return_value.stop.assert_awaited_once()
+
+    responses = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [r["id"] for r in responses] == [1, 2]
+    assert responses[0]["result"]["server"] == "petrosa-cio-mcp"
+    assert responses[1]["error"]["code"] == -32000
+
+
+@pytest.mark.asyncio
+async def test_mcp_server_run_stdio_rejects_oversized_lines(capsys):
+    """Lines over the reader limit get -32600 without being parsed."""
+    with (
+        patch("cio.mcp_server.discover_schema_models", return_value={}),
+        patch("cio.mcp_server.generate_tools", return_value=[]),
+        patch("cio.mcp_server.RateGovernor") as MockRateGovernor,
+    ):
+        MockRateGovernor.return_value.start = AsyncMock()
+        MockRateGovernor.return_value.stop = AsyncMock()
+
+        server = MCPServer(
+            config_manager=MagicMock(),
+            roi_engine=MagicMock(),
+            memory_service=MagicMock(),
+        )
+        requests = (
+            b"x" * 500
+            + b"\n"
+            + b'{"jsonrpc": "2.0", "id": 7, "method": "initialize"}\n'
+            + b"y" * 500
+        )
+        reader = _stdin_reader(requests, limit=128)
+        with patch.object(server, "_open_stdin_reader", AsyncMock(return_value=reader)):
+            await server.run_stdio()
+
+    responses = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [r.get("id") for r in responses] == [None, 7, None]
+    assert responses[0]["error"] == {"code": -32600, "message": "request too large"}
+    assert responses[2]["error"]["code"] == -32600
+
+
+@pytest.mark.asyncio
+async def test_mcp_server_run_stdio_reads_redirected_file(tmp_path, capsys):
+    """A regular file on stdin (``< requests.jsonl``) is served, not rejected."""
+    requests_file = tmp_path / "requests.jsonl"
+    requests_file.write_bytes(
+        b'{"jsonrpc": "2.0", "id": 1, "method": "initialize"}\n'
+        b'{"jsonrpc": "2.0", "id": 2, "method": "initialize"}'
+    )
+    with (
+        patch("cio.mcp_server.discover_schema_models", return_value={}),
+        patch("cio.mcp_server.generate_tools", return_value=[]),
+        patch("cio.mcp_server.RateGovernor") as MockRateGovernor,
+        open(requests_file) as stdin,
+        patch("sys.stdin", stdin),
+    ):
+        MockRateGovernor.return_value.start = AsyncMock()
+        MockRateGovernor.return_value.stop = AsyncMock()
+
+        server = MCPServer(
+            config_manager=MagicMock(),
+            roi_engine=MagicMock(),
+            memory_service=MagicMock(),
+        )
+        await server.run_stdio()
+
+    responses = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [r["id"] for r in responses] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_mcp_server_run_stdio_cancels_stdin_feeder_on_error():
+    """An early exit (malformed line) must not leave the feeder task pending."""
+    with (
+        patch("cio.mcp_server.discover_schema_models", return_value={}),
+        patch("cio.mcp_server.generate_tools", return_value=[]),
+        patch("cio.mcp_server.RateGovernor") as MockRateGovernor,
+    ):
+        MockRateGovernor.return_value.start = AsyncMock()
+        MockRateGovernor.return_value.stop = AsyncMock()
+
+        server = MCPServer(
+            config_manager=MagicMock(),
+            roi_engine=MagicMock(),
+            memory_service=MagicMock(),
+        )
+        reader = asyncio.StreamReader()
+        reader.feed_data(b"not json\n")
+        feeder = asyncio.create_task(asyncio.Event().wait())
+
+        async def _open_reader():
+            server._stdin_feeder = feeder
+            return reader
+
+        with (
+            patch.object(server, "_open_stdin_reader", _open_reader),
+            pytest.raises(orjson.JSONDecodeError),
+        ):
+            await server.run_stdio()
+
+        MockRateGovernor.return_value.stop.assert_awaited_once()
+
+    assert feeder.cancelled()
+    assert server._stdin_feeder is None
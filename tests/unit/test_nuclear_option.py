@@ -0,0 +1,194 @@
+"""Tests for the standalone emergency close-all script (canary/nuclear_option.py)."""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from canary.nuclear_option import CloseAction, fetch_all_positions, market_close_all
+
+
+def test_fetch_all_positions_reads_exchanges_concurrently():
+    """Spot balance and futures positions are in flight at once; markets load first."""
+    barrier = threading.Barrier(2, timeout=2)
+
+    def _after_barrier(value):
+        def _call():
+            barrier.wait()
+            return value
+
+        return _call
+
+    spot = MagicMock()
+    spot.fetch_balance.side_effect = _after_barrier(
+        {"total": {"BTC": 0.5, "USDT": 100.0, "DOGE": 0.0, "XYZ": 3.0}}
+    )
+    spot.load_markets.return_value = {"BTC/USDT": {}, "USDT/USDT": {}}
+    futures = MagicMock()
+    futures.fetch_positions.side_effect = _after_barrier(
+        [
+            {"symbol": "ETH/USDT:USDT", "contracts": -2},
+            {"symbol": "SOL/USDT:USDT", "contracts": 0},
+        ]
+    )
+
+    actions = fetch_all_positions(spot, futures)
+
+    assert actions == [
+        CloseAction(market="spot", symbol="BTC/USDT", side="sell", amount=0.5),
+        CloseAction(market="futures", symbol="ETH/USDT:USDT", side="buy", amount=2.0),
+    ]
+    # Markets were loaded before the spot balance read was submitted
+    assert [c[0] for c in spot.method_calls] == ["load_markets", "fetch_balance"]
+
+
+def _actions() -> list[CloseAction]:
+    return [
+        CloseAction(market="futures", symbol="ETH/USDT:USDT", side="buy", amount=2.0),
+        CloseAction(market="spot", symbol="BTC/USDT", side="sell", amount=0.5),
+        CloseAction(market="futures", symbol="SOL/USDT:USDT", side="sell", amount=1.0),
+    ]
+
+
+def test_market_close_all_batches_futures_orders():
+    spot = MagicMock()
+    spot.create_order.return_value = {"id": "s-1"}
+    futures = MagicMock()
+    futures.has = {"createOrders": True}
+
+    def _reply_out_of_order(orders):
+        eth, sol = orders
+        # SOL is rejected; the reply lists it first, unlike the request.
+        return [
+            {"id": None, "clientOrderId": None, "info": {"code": -2019}},
+            {
+                "id": "f-1",
+                "clientOrderId": eth["params"]["newClientOrderId"],
+                "symbol": eth["symbol"],
+            },
+        ]
+
+    futures.create_orders.side_effect = _reply_out_of_order
+
+    results = market_close_all(
+        _actions(),
+        spot_exchange=spot,
+        futures_exchange=futures,
+        dry_run=False,
+        batch_size=5,
+        rate_limit_ms=0,
+    )
+
+    futures.create_orders.assert_called_once()
+    requested = futures.create_orders.call_args.args[0]
+    assert [o["symbol"] for o in requested] == ["ETH/USDT:USDT", "SOL/USDT:USDT"]
+    client_ids = [o["params"]["newClientOrderId"] for o in requested]
+    assert len(set(client_ids)) == 2
+    assert all(len(cid) <= 36 for cid in client_ids)
+    futures.create_order.assert_not_called()
+    spot.create_order.assert_called_once_with("BTC/USDT", "market", "sell", 0.5)
+    # Results keep the original action order.
+    assert [r["status"] for r in results] == ["executed", "executed", "unknown"]
+    assert results[0]["order_id"] == "f-1"
+    assert results[2]["symbol"] == "SOL/USDT:USDT"
+    assert "-2019" in results[2]["error"]
+
+
+def test_market_close_all_matches_timestamp_sorted_ccxt_reply():
+    """ccxt's parse_orders puts error entries (no timestamp) before fills."""
+    ccxt = pytest.importorskip("ccxt")
+    parser = ccxt.binanceusdm()
+    futures = MagicMock()
+    futures.has = {"createOrders": True}
+
+    def _binance_batch_reply(orders):
+        eth = orders[0]
+        raw = [
+            {
+                "orderId": "1",
+                "symbol": "ETHUSDT",
+                "status": "FILLED",
+                "clientOrderId": eth["params"]["newClientOrderId"],
+                "origQty": "2",
+                "executedQty": "2",
+                "type": "MARKET",
+                "side": "BUY",
+                "updateTime": 1700000000000,
+            },
+            {"code": -2019, "msg": "Margin is insufficient."},
+        ]
+        return parser.parse_orders(raw)
+
+    futures.create_orders.side_effect = _binance_batch_reply
+
+    results = market_close_all(
+        [a for a in _actions() if a.market == "futures"],
+        spot_exchange=MagicMock(),
+        futures_exchange=futures,
+        dry_run=False,
+        batch_size=5,
+        rate_limit_ms=0,
+    )
+
+    assert [(r["symbol"], r["status"]) for r in results] == [
+        ("ETH/USDT:USDT", "executed"),
+        ("SOL/USDT:USDT", "unknown"),
+    ]
+    assert results[0]["order_id"] == "1"
+    assert "Margin is insufficient" in results[1]["error"]
+
+
+def test_market_close_all_does_not_resubmit_failed_batch():
+    futures = MagicMock()
+    futures.has = {"createOrders": True}
+    futures.create_orders.side_effect = RuntimeError("timeout")
+
+    results = market_close_all(
+        [a for a in _actions() if a.market == "futures"],
+        spot_exchange=MagicMock(),
+        futures_exchange=futures,
+        dry_run=False,
+        batch_size=5,
+        rate_limit_ms=0,
+    )
+
+    futures.create_order.assert_not_called()
+    assert [r["status"] for r in results] == ["failed", "failed"]
+
+
+def test_market_close_all_falls_back_to_single_orders():
+    spot = MagicMock()
+    spot.create_order.return_value = {"id": "s-1"}
+    futures = MagicMock()
+    futures.has = {"createOrders": False}
+    futures.create_order.return_value = {"id": "f-1"}
+
+    results = market_close_all(
+        _actions(),
+        spot_exchange=spot,
+        futures_exchange=futures,
+        dry_run=False,
+        batch_size=2,
+        rate_limit_ms=0,
+    )
+
+    futures.create_orders.assert_not_called()
+    assert futures.create_order.call_count == 2
+    assert [r["status"] for r in results] == ["executed"] * 3
+
+
+def test_market_close_all_dry_run_places_nothing():
+    spot, futures = MagicMock(), MagicMock()
+
+    results = market_close_all(
+        _actions(),
+        spot_exchange=spot,
+        futures_exchange=futures,
+        dry_run=True,
+        batch_size=5,
+        rate_limit_ms=0,
+    )
+
+    assert [r["status"] for r in results] == ["dry_run"] * 3
+    spot.create_order.assert_not_called()
+    futures.create_orders.assert_not_called()
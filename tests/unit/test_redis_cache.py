@@ -0,0 +1,55 @@
+"""Tests for the batched helpers on AsyncRedisCache."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from cio.core.cache import AsyncRedisCache
+
+
+@pytest.mark.asyncio
+async def test_get_many_uses_single_mget():
+    redis = MagicMock()
+    redis.mget = AsyncMock(return_value=[b"1", None, b""])
+    cache = AsyncRedisCache(redis)
+
+    assert await cache.get_many(["a", "b", "c"]) == ["1", None, None]
+    redis.mget.assert_awaited_once_with(["a", "b", "c"])
+
+
+@pytest.mark.asyncio
+async def test_get_many_passes_through_decoded_strings():
+    """Clients created with decode_responses=True already return str."""
+    redis = MagicMock()
+    redis.mget = AsyncMock(return_value=["1", b"2", ""])
+    cache = AsyncRedisCache(redis)
+
+    assert await cache.get_many(["a", "b", "c"]) == ["1", "2", None]
+
+
+@pytest.mark.asyncio
+async def test_get_many_returns_misses_on_error():
+    redis = MagicMock()
+    redis.mget = AsyncMock(side_effect=ConnectionError("down"))
+    cache = AsyncRedisCache(redis)
+
+    assert await cache.get_many(["a", "b"]) == [None, None]
+
+
+@pytest.mark.asyncio
+async def test_set_many_pipelines_writes_with_ttls():
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    pipeline_cm = MagicMock()
+    pipeline_cm.__aenter__ = AsyncMock(return_value=pipe)
+    pipeline_cm.__aexit__ = AsyncMock(return_value=False)
+    redis = MagicMock()
+    redis.pipeline.return_value = pipeline_cm
+    cache = AsyncRedisCache(redis)
+
+    await cache.set_many({"a": ("1", 60), "b": ("x", 300)})
+
+    redis.pipeline.assert_called_once_with(transaction=False)
+    pipe.set.assert_any_call("a", "1", ex=60)
+    pipe.set.assert_any_call("b", "x", ex=300)
+    pipe.execute.assert_awaited_once()
@@ -29,8 +29,17 @@ def _make_cache(store: dict | None = None) -> MagicMock:
     async def _set(key: str, value: str, ttl: int = 900):
         store[key] = value
 
+    async def _get_many(keys: list[str]):
+        return [store.get(key) for key in keys]
+
+    async def _set_many(items: dict[str, tuple[str, int]]):
+        for key, (value, _ttl) in items.items():
+            store[key] = value
+
     cache.get = AsyncMock(side_effect=_get)
     cache.set = AsyncMock(side_effect=_set)
+    cache.get_many = AsyncMock(side_effect=_get_many)
+    cache.set_many = AsyncMock(side_effect=_set_many)
     return cache
 
 
@@ -190,6 +199,22 @@ async def test_side_normalisation_long_equals_buy():
     assert "SIGNAL_DEDUPLICATED" in r2
 
 
+@pytest.mark.asyncio
+async def test_side_normalisation_is_case_insensitive():
+    """Mixed-case sides fall back to the lowercase lookup and still dedup."""
+    store = {}
+    cache = _make_cache(store)
+    arbiter = SignalArbiter(cache)
+
+    ok1, _ = await arbiter.check("BTCUSDT", "LONG", 0.8, "strat_a", "cid1")
+    assert ok1 is True
+    assert "arbiter:dedup:BTCUSDT:buy" in store
+
+    ok2, r2 = await arbiter.check("BTCUSDT", "Buy", 0.9, "strat_b", "cid2")
+    assert ok2 is False
+    assert "SIGNAL_DEDUPLICATED" in r2
+
+
 @pytest.mark.asyncio
 async def test_missing_symbol_bypasses_arbitration():
     """Empty symbol bypasses arbitration (signal passes through)."""
@@ -307,3 +332,26 @@ async def test_nats_listener_arbiter_malformed_confidence_uses_default():
     # Should not raise — confidence defaults to 0.5
     await listener._handle_message(msg)
     enforcer.audit.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_nats_listener_drops_non_finite_json_payload():
+    """orjson rejects NaN/Infinity literals, so such intents are parse errors."""
+    enforcer = MagicMock()
+    enforcer.audit = AsyncMock()
+    listener = NATSListener(
+        nats_client=MagicMock(),
+        enforcer=enforcer,
+        context_builder=MagicMock(),
+        router=MagicMock(),
+        arbiter=None,
+    )
+
+    msg = MagicMock(spec=Msg)
+    msg.headers = None
+    msg.subject = "cio.intent.trading.strat_x"
+    msg.data = b'{"symbol": "ETHUSDT", "action": "buy", "confidence": NaN}'
+
+    await listener._handle_message(msg)
+
+    enforcer.audit.assert_not_called()